@@ -7,6 +7,7 @@ import pandas as pd
 import os
 import datetime
 from gspread.exceptions import WorksheetNotFound, APIError
+from requests.adapters import HTTPAdapter
 import data_updater
 
 # Auto-sync helpers (only for /search_club command)
@@ -21,20 +22,45 @@ import time
 import pytz
 import sys
 import subprocess
+import threading
 import random
+import re
 import asyncio
-from typing import Tuple, Optional, List
-from dataclasses import dataclass
-from collections import Counter
+import bisect
+import hashlib
+import logging
+import logging.handlers
+import queue
+from typing import Any, Tuple, Optional, List, Sequence
+from dataclasses import dataclass, field
+import functools
+from functools import lru_cache
+from itertools import islice
+from collections import Counter, OrderedDict, defaultdict
 from dotenv import load_dotenv
 from wcwidth import wcswidth
-from io import StringIO
+from io import BytesIO, StringIO
+
+# orjson is optional - the Leaders/Officers cells fall back to stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 
 # Load environment variables from .env file
 load_dotenv()
 
+# Error logging: handlers only enqueue records; the listener thread (started in
+# ClubManagementBot.setup_hook) formats and writes them off the event loop
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+logger.propagate = False
+_log_record_queue = queue.Queue(-1)
+logger.addHandler(logging.handlers.QueueHandler(_log_record_queue))
+_log_listener = logging.handlers.QueueListener(_log_record_queue, logging.StreamHandler())
+
 # ============================================================================
 # SMART DATA CACHE WITH DISK PERSISTENCE
 # ============================================================================
@@ -234,6 +260,13 @@ class BotConfig:
 
 config = BotConfig()
 
+# God mode IDs never change at runtime - frozenset for O(1) membership on hot paths
+GOD_MODE_USER_ID_SET = frozenset(config.GOD_MODE_USER_IDS)
+
+# Timezones resolved once - used for timestamps in config/log files and embeds
+VN_TZ = pytz.timezone('Asia/Ho_Chi_Minh')
+UTC_TZ = datetime.timezone.utc
+
 # ============================================================================
 # FILE PATHS
 # ============================================================================
@@ -244,6 +277,8 @@ LAST_UPDATE_FILE_PATH = os.path.join(SCRIPT_DIR, "last_update.json")
 CACHE_DIR = os.path.join(SCRIPT_DIR, "data_cache")
 CONFIG_CACHE_FILE = os.path.join(CACHE_DIR, "config_cache.json")
 MEMBER_CACHE_FILE = os.path.join(CACHE_DIR, "member_cache.json")
+CLUB_CACHE_DIR = os.path.join(CACHE_DIR, "clubs")  # One config file per club
+CLUB_CACHE_INDEX_FILE = os.path.join(CLUB_CACHE_DIR, "_index.json")  # {club_name: filename}
 DATA_CACHE_DIR = os.path.join(CACHE_DIR, "data")
 SMART_CACHE_DIR = os.path.join(CACHE_DIR, "smart_cache")
 
@@ -251,6 +286,7 @@ SMART_CACHE_DIR = os.path.join(CACHE_DIR, "smart_cache")
 os.makedirs(CACHE_DIR, exist_ok=True)
 os.makedirs(DATA_CACHE_DIR, exist_ok=True)
 os.makedirs(SMART_CACHE_DIR, exist_ok=True)
+os.makedirs(CLUB_CACHE_DIR, exist_ok=True)
 
 # Initialize smart cache with 24-hour TTL (data updates daily)
 smart_cache = SmartCache(SMART_CACHE_DIR, ttl_seconds=86400)
@@ -259,6 +295,7 @@ smart_cache = SmartCache(SMART_CACHE_DIR, ttl_seconds=86400)
 ALLOWED_CHANNELS_CONFIG_FILE = os.path.join(SCRIPT_DIR, "allowed_channels_config.json")
 ADMIN_LIST_FILE = os.path.join(SCRIPT_DIR, "admin_list.json")
 CHANNEL_CHANGE_LOG_FILE = os.path.join(SCRIPT_DIR, "channel_change_log.json")
+CHANNEL_CONFIG_MIGRATED_FILE = os.path.join(SCRIPT_DIR, ".migrated_channel_config")  # Sentinel
 
 # Channel IDs - loaded from environment variables for security
 LOGGING_CHANNEL_ID = int(os.getenv('LOGGING_CHANNEL_ID', '0'))
@@ -271,8 +308,36 @@ CHANNEL_LIST_CONFIG_FILE = os.path.join(SCRIPT_DIR, "channel_list_config.json")
 # Global leaderboard display system
 GLOBAL_LEADERBOARD_CONFIG_FILE = os.path.join(SCRIPT_DIR, "global_leaderboard_config.json")
 
-# Global state for pending club requests
+# Command logging - batched by a single worker (see ClubManagementBot._log_worker)
+COMMAND_LOG_QUEUE_SIZE = 1000
+COMMAND_LOG_BATCH_SIZE = 10  # Max commands per log embed (well under the 25-field limit)
+COMMAND_LOG_BATCH_WINDOW = 2  # Seconds to wait for more commands before sending
+
+# Administrator permission cache used by global_channel_check
+PERMISSION_CACHE_TTL = 30  # seconds
+PERMISSION_CACHE_MAX_SIZE = 4096
+
+# Users fetched over REST by get_or_fetch_user (requester DMs, role listings)
+FETCHED_USER_CACHE_TTL = 3600  # seconds
+FETCHED_USER_CACHE_MAX_SIZE = 1024
+
+# Global state for pending club requests: {user_id: PendingClubRequest}
+@dataclass(slots=True)
+class PendingClubRequest:
+    """Club request waiting for the requester to DM a custom name"""
+    club_data: dict
+    api_data: dict
+    requester_info: dict
+    original_name: str
+    club_type: str
+    target_quota: int
+    admin_channel_id: int
+    timestamp: float
+    awaiting_custom_name: bool = True
+    timer: Optional[asyncio.TimerHandle] = field(default=None, repr=False)  # Expiry callback
+
 pending_requests = {}
+PENDING_REQUEST_TTL = 300  # 5 minutes to reply with a custom name
 
 # Support server
 SUPPORT_SERVER_URL = os.getenv('SUPPORT_SERVER_URL', "https://discord.com/invite/touchclub")
@@ -332,8 +397,74 @@ OCR_SERVICE_URL = os.getenv("OCR_SERVICE_URL", "http://2.56.246.119:30404")
 PROFILE_LINKS_FILE = os.path.join(SCRIPT_DIR, "profile_links.json")
 EXAMPLE_PROFILE_IMAGE = os.path.join(SCRIPT_DIR, "assets", "example_profile.png")
 
-# Pending verification requests: {user_id: {"member_name": str, "club_name": str, "expires": datetime}}
+# Pending verification requests: {user_id: PendingVerification}
+@dataclass(slots=True)
+class PendingVerification:
+    """Profile verification waiting for the user's screenshot"""
+    member_name: str
+    club_name: str
+    channel_id: int  # DM channel
+    original_channel_id: int
+    expires_ts: float
+    timer: Optional[asyncio.TimerHandle] = field(default=None, repr=False)  # Expiry callback
+
 pending_verifications = {}
+PENDING_VERIFICATION_TTL = 300  # 5 minutes to send the screenshot
+CANCEL_WORDS = frozenset({'cancel', 'c', 'stop', 'quit'})
+CANCEL_WORD_MAX_LEN = 8  # Longer messages are never a cancel word, even padded
+
+# OCR calls: capped overall, one in flight per user
+OCR_MAX_CONCURRENCY = 4
+OCR_TIMEOUT = 20  # seconds
+_ocr_sem = asyncio.Semaphore(OCR_MAX_CONCURRENCY)
+_ocr_inflight = set()  # user IDs with an OCR call running
+_ocr_cache: OrderedDict = OrderedDict()  # {blake2b digest: ocr result}, LRU
+_OCR_CACHE_MAX = 256
+
+# Expiry notifications started from timer callbacks (kept referenced until done)
+_expiry_tasks = set()
+
+
+def _spawn_expiry(coro):
+    """Run an expiry coroutine from a loop.call_later callback"""
+    task = asyncio.create_task(coro)
+    _expiry_tasks.add(task)
+    task.add_done_callback(_expiry_tasks.discard)
+
+
+def add_pending_request(user_id: int, request: PendingClubRequest):
+    """Store a pending custom-name request and schedule its expiry"""
+    remove_pending_request(user_id)  # Replacing an older request drops its timer
+    request.timer = asyncio.get_running_loop().call_later(
+        PENDING_REQUEST_TTL, lambda: _spawn_expiry(_expire_request(user_id))
+    )
+    pending_requests[user_id] = request
+
+
+def remove_pending_request(user_id: int) -> Optional[PendingClubRequest]:
+    """Drop a pending custom-name request and cancel its expiry"""
+    request = pending_requests.pop(user_id, None)
+    if request and request.timer:
+        request.timer.cancel()
+    return request
+
+
+def add_pending_verification(user_id: int, verification: PendingVerification):
+    """Store a pending profile verification and schedule its expiry"""
+    remove_pending_verification(user_id)
+    verification.timer = asyncio.get_running_loop().call_later(
+        max(0, verification.expires_ts - time.time()),
+        lambda: _spawn_expiry(_expire_verification(user_id))
+    )
+    pending_verifications[user_id] = verification
+
+
+def remove_pending_verification(user_id: int) -> Optional[PendingVerification]:
+    """Drop a pending profile verification and cancel its expiry"""
+    verification = pending_verifications.pop(user_id, None)
+    if verification and verification.timer:
+        verification.timer.cancel()
+    return verification
 
 
 
@@ -428,17 +559,20 @@ def load_profile_links() -> dict:
             pass
     return {}
 
+_profile_links_lock = threading.Lock()  # Serializes read-modify-write from worker threads
+
 def save_profile_link(discord_id: int, trainer_id: str, member_name: str, club_name: str):
-    """Save a verified profile link"""
-    links = load_profile_links()
-    links[str(discord_id)] = {
-        "trainer_id": trainer_id,
-        "member_name": member_name,
-        "club_name": club_name,
-        "linked_at": datetime.datetime.now(datetime.timezone.utc).isoformat()
-    }
-    with open(PROFILE_LINKS_FILE, 'w', encoding='utf-8') as f:
-        json.dump(links, f, indent=2)
+    """Save a verified profile link (blocking - call via asyncio.to_thread)"""
+    with _profile_links_lock:
+        links = load_profile_links()
+        links[str(discord_id)] = {
+            "trainer_id": trainer_id,
+            "member_name": member_name,
+            "club_name": club_name,
+            "linked_at": datetime.datetime.now(UTC_TZ).isoformat()
+        }
+        with open(PROFILE_LINKS_FILE, 'w', encoding='utf-8') as f:
+            json.dump(links, f, indent=2)
 
 async def call_ocr_service(image_data: bytes) -> dict:
     """Call Node.js OCR service to extract trainer data from image"""
@@ -582,13 +716,13 @@ class ProfileOwnershipView(discord.ui.View):
             dm_channel = await interaction.user.create_dm()
             
             # Store pending verification with DM channel
-            pending_verifications[interaction.user.id] = {
-                "member_name": self.member_name,
-                "club_name": self.club_name,
-                "channel_id": dm_channel.id,  # Use DM channel
-                "original_channel_id": interaction.channel_id,
-                "expires": datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(minutes=5)
-            }
+            add_pending_verification(interaction.user.id, PendingVerification(
+                member_name=self.member_name,
+                club_name=self.club_name,
+                channel_id=dm_channel.id,  # Use DM channel
+                original_channel_id=interaction.channel_id,
+                expires_ts=time.time() + PENDING_VERIFICATION_TTL
+            ))
             
             # Send DM with example image
             message_content = (
@@ -618,8 +752,7 @@ class ProfileOwnershipView(discord.ui.View):
                 "❌ I couldn't send you a DM. Please enable DMs from server members and try again.",
                 ephemeral=True
             )
-            if interaction.user.id in pending_verifications:
-                del pending_verifications[interaction.user.id]
+            remove_pending_verification(interaction.user.id)
         except Exception as e:
             print(f"Error sending DM for verification: {e}")
             await interaction.followup.send(
@@ -867,6 +1000,11 @@ except Exception as e:
     USE_SUPABASE = False
     print(f"⚠️ Supabase unavailable: {e}")
 
+# Keep-alive connections kept by the shared gspread session - sized for the
+# Sheets calls that run at once on asyncio.to_thread workers, so concurrent
+# batches reuse open TLS connections instead of discarding them
+GSHEETS_POOL_MAXSIZE = 16
+
 # Google Sheets Manager (for stats data with timeout handling)
 class GoogleSheetsManager:
     """Manages Google Sheets connection with retry logic"""
@@ -874,6 +1012,7 @@ class GoogleSheetsManager:
     def __init__(self):
         self.gc = None
         self.sh = None
+        self.config_ws = None  # Clubs_Config handle, reused until reconnect
         self.connected = False
         self._connect()
     
@@ -881,7 +1020,12 @@ class GoogleSheetsManager:
         """Establish connection to Google Sheets"""
         try:
             self.gc = gspread.service_account(filename=config.SERVICE_ACCOUNT_FILE)
+            # One authorized session for every worksheet handle (retries stay in our own code)
+            self.gc.session.mount(
+                "https://", HTTPAdapter(pool_connections=1, pool_maxsize=GSHEETS_POOL_MAXSIZE)
+            )
             self.sh = self.gc.open_by_key(config.GOOGLE_SHEET_ID)
+            self.config_ws = None
             self.connected = True
             print("Bot: Connected to Google Sheets.")
             self._verify_config_sheet()
@@ -896,7 +1040,7 @@ class GoogleSheetsManager:
     def _verify_config_sheet(self):
         """Verify the config sheet has correct headers"""
         try:
-            config_ws = self.sh.worksheet(config.CONFIG_SHEET_NAME)
+            config_ws = self.get_config_worksheet()
             headers = config_ws.row_values(1)
             expected_headers = [
                 'Club_Name', 'Data_Sheet_Name', 'Members_Sheet_Name',
@@ -910,6 +1054,12 @@ class GoogleSheetsManager:
         except WorksheetNotFound:
             print(f"ERROR (Bot): '{config.CONFIG_SHEET_NAME}' sheet not found.")
     
+    def get_config_worksheet(self):
+        """Clubs_Config worksheet, looked up once (blocking on first call) and then reused"""
+        if self.config_ws is None:
+            self.config_ws = self.sh.worksheet(config.CONFIG_SHEET_NAME)
+        return self.config_ws
+    
     def get_worksheet_with_retry(self, sheet_name: str, max_retries: int = None) -> list:
         """Get worksheet data with enhanced retry logic
         
@@ -946,6 +1096,190 @@ class GoogleSheetsManager:
 
 gs_manager = GoogleSheetsManager()
 
+
+CONFIG_WRITE_WINDOW = 0.2  # Seconds to collect cell writes for the same row before flushing
+
+
+class ConfigCellWriter:
+    """Coalesces Clubs_Config cell writes per row into one batch_update call
+    
+    Writes to the same (worksheet, row) arriving within CONFIG_WRITE_WINDOW
+    share a single Sheets request; the last value per column wins. Every
+    caller gets the same future, resolved (or failed) when the batch lands.
+    """
+    
+    def __init__(self, window: float = CONFIG_WRITE_WINDOW):
+        self.window = window
+        self._pending = {}  # {(worksheet id, row): (worksheet, {col: value}, future)}
+        self._flush_tasks = set()
+    
+    def enqueue(self, worksheet, row: int, col: int, value) -> asyncio.Future:
+        """Queue a cell write; await the returned future to wait for the flush"""
+        key = (worksheet.id, row)
+        entry = self._pending.get(key)
+        if entry is None:
+            entry = (worksheet, {}, asyncio.get_running_loop().create_future())
+            self._pending[key] = entry
+            task = asyncio.create_task(self._flush_after(key))
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_tasks.discard)
+        entry[1][col] = value
+        return entry[2]
+    
+    async def _flush_after(self, key):
+        """Send one row's queued cells once the window has passed"""
+        await asyncio.sleep(self.window)
+        worksheet, cells, future = self._pending.pop(key)
+        row = key[1]
+        try:
+            await asyncio.to_thread(
+                worksheet.batch_update,
+                [
+                    {'range': gspread.utils.rowcol_to_a1(row, col), 'values': [[value]]}
+                    for col, value in cells.items()
+                ],
+                value_input_option='USER_ENTERED'  # Same as update_cell
+            )
+        except Exception as e:
+            if not future.done():  # A cancelled waiter cancels the shared future
+                future.set_exception(e)
+        else:
+            if not future.done():
+                future.set_result(None)
+
+
+config_writer = ConfigCellWriter()
+
+CONFIG_WRITE_RETRIES = 3
+_persist_tasks = set()
+# Latest write generation per (worksheet id, row, col); a retry whose value has
+# been superseded by a newer write is dropped so it can't overwrite it
+_persist_generations = {}
+
+
+@dataclass(slots=True)
+class FailedConfigWrite:
+    """A background Clubs_Config write that ran out of retries"""
+    config_sheet: gspread.Worksheet
+    row: int
+    col: int
+    value: Any
+    club_name: str
+    field_name: str
+    generation: int
+    error: str
+
+
+async def _persist_cell(
+    config_sheet,
+    row: int,
+    col: int,
+    value,
+    club_name: str,
+    field_name: str,
+    generation: int,
+    interaction: Optional[discord.Interaction] = None
+):
+    """Write one Clubs_Config cell, retrying transient errors with backoff
+    
+    A write that still fails is kept in client.failed_config_writes (retried
+    before the next full cache reload) and reported to the command's user.
+    """
+    cell_key = (config_sheet.id, row, col)
+    for attempt in range(CONFIG_WRITE_RETRIES):
+        if attempt and _persist_generations.get(cell_key) != generation:
+            logger.info("Dropping stale %s retry for %s (newer write queued)", field_name, club_name)
+            return
+        try:
+            await config_writer.enqueue(config_sheet, row, col, value)
+        except Exception as e:
+            if attempt + 1 < CONFIG_WRITE_RETRIES and is_retryable_error(e):
+                await asyncio.sleep(config.RETRY_DELAY * (2 ** attempt))
+                continue
+            logger.error("Failed to write %s for %s to Sheets: %s", field_name, club_name, e)
+            client.failed_config_writes[cell_key] = FailedConfigWrite(
+                config_sheet, row, col, value, club_name, field_name, generation, repr(e)
+            )
+            if interaction is not None:
+                try:
+                    await interaction.followup.send(
+                        f"⚠️ The new {field_name} for `{club_name}` could not be saved to Google Sheets: {e}\n"
+                        "It will be retried before the next cache refresh; if that also fails "
+                        "the change is reverted, so please run the command again later.",
+                        ephemeral=True
+                    )
+                except discord.HTTPException:
+                    pass
+            return
+        else:
+            # This write supersedes any earlier failure for the same cell
+            failed = client.failed_config_writes.get(cell_key)
+            if failed is not None and failed.generation <= generation:
+                del client.failed_config_writes[cell_key]
+            return
+
+
+def persist_cell_in_background(
+    config_sheet,
+    row: int,
+    col: int,
+    value,
+    club_name: str,
+    field_name: str,
+    interaction: Optional[discord.Interaction] = None
+):
+    """Write-through for a cache update that has already been applied in memory
+    
+    Pass the command's interaction so a write that never lands is reported.
+    """
+    cell_key = (config_sheet.id, row, col)
+    generation = _persist_generations.get(cell_key, 0) + 1
+    _persist_generations[cell_key] = generation
+    task = asyncio.create_task(
+        _persist_cell(config_sheet, row, col, value, club_name, field_name, generation, interaction)
+    )
+    _persist_tasks.add(task)
+    task.add_done_callback(_persist_tasks.discard)
+
+
+async def retry_failed_config_writes():
+    """Send failed config writes once more, before a full reload replaces config_cache
+    
+    Writes that still fail (or were superseded) are dropped: the reload then
+    brings the cache back in line with what Sheets actually holds.
+    """
+    failed_writes = client.failed_config_writes
+    if not failed_writes:
+        return
+    pending = [
+        failed for cell_key, failed in failed_writes.items()
+        if _persist_generations.get(cell_key) == failed.generation
+    ]
+    failed_writes.clear()
+    results = await asyncio.gather(
+        *(config_writer.enqueue(f.config_sheet, f.row, f.col, f.value) for f in pending),
+        return_exceptions=True
+    )
+    for failed, result in zip(pending, results):
+        if isinstance(result, BaseException):
+            logger.error(
+                "Dropping %s for %s after a final failed write (cache reverts to Sheets): %s",
+                failed.field_name, failed.club_name, result
+            )
+        else:
+            logger.info("Saved %s for %s on retry", failed.field_name, failed.club_name)
+
+
+# Follow-up work the user doesn't wait for (cache refreshes, requester DMs)
+_background_tasks = set()
+
+
+def run_in_background(coro):
+    """Start a coroutine without awaiting it (kept referenced until done)"""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
 # ============================================================================
 # HYBRID DATABASE WRAPPER - Intelligent Failover
 # ============================================================================
@@ -970,7 +1304,7 @@ def is_admin_or_has_role():
     """Check if user is admin or has required role"""
     async def predicate(interaction: discord.Interaction) -> bool:
         # God mode always has access
-        if interaction.user.id in config.GOD_MODE_USER_IDS:
+        if interaction.user.id in GOD_MODE_USER_ID_SET:
             return True
         
         # Must be in a guild context
@@ -1003,7 +1337,7 @@ def is_admin_or_has_role():
 def is_primary_admin():
     """Check if user is primary admin"""
     async def predicate(interaction: discord.Interaction) -> bool:
-        return interaction.user.id in config.GOD_MODE_USER_IDS
+        return interaction.user.id in GOD_MODE_USER_ID_SET
     return app_commands.check(predicate)
 
 
@@ -1011,7 +1345,7 @@ def is_leader_or_admin():
     """Check if user is Leader, Server Admin, or God Mode (Officers cannot use)"""
     async def predicate(interaction: discord.Interaction) -> bool:
         # God mode always has access
-        if interaction.user.id in config.GOD_MODE_USER_IDS:
+        if interaction.user.id in GOD_MODE_USER_ID_SET:
             return True
         
         # Must be in a guild context
@@ -1028,14 +1362,8 @@ def is_leader_or_admin():
         except (AttributeError, TypeError):
             pass
         
-        # Check if user is a Leader (NOT Officer)
-        # We need to check all clubs to see if user is leader of ANY club
-        for club_name, club_config in client.config_cache.items():
-            leaders = club_config.get('Leaders', [])
-            if interaction.user.id in leaders:
-                return True
-        
-        return False
+        # Check if user is a Leader (NOT Officer) of ANY club
+        return interaction.user.id in client.leader_index
     return app_commands.check(predicate)
 
 
@@ -1043,7 +1371,7 @@ def is_leader_or_admin():
 def is_god_mode_only():
     """Check if user is God mode - error handled by global error handler"""
     async def predicate(interaction: discord.Interaction) -> bool:
-        return interaction.user.id in config.GOD_MODE_USER_IDS
+        return interaction.user.id in GOD_MODE_USER_ID_SET
     return app_commands.check(predicate)
 
 
@@ -1086,7 +1414,7 @@ def add_channel_to_config(interaction: discord.Interaction) -> dict:
         "server_name": interaction.guild.name if interaction.guild else "Unknown",
         "added_by": interaction.user.id,
         "added_by_name": str(interaction.user),
-        "added_at": datetime.datetime.now(pytz.timezone('Asia/Ho_Chi_Minh')).strftime("%Y-%m-%d %H:%M:%S")
+        "added_at": datetime.datetime.now(VN_TZ).strftime("%Y-%m-%d %H:%M:%S")
     }
     
     # Add to list
@@ -1095,7 +1423,7 @@ def add_channel_to_config(interaction: discord.Interaction) -> dict:
     # Save to file
     config_data = {
         "channels": existing_channels,
-        "last_updated": datetime.datetime.now(pytz.timezone('Asia/Ho_Chi_Minh')).strftime("%Y-%m-%d %H:%M:%S")
+        "last_updated": datetime.datetime.now(VN_TZ).strftime("%Y-%m-%d %H:%M:%S")
     }
     
     with open(ALLOWED_CHANNELS_CONFIG_FILE, 'w', encoding='utf-8') as f:
@@ -1121,7 +1449,7 @@ def remove_channel_from_config(channel_id: int) -> bool:
     # Save updated list
     config_data = {
         "channels": existing_channels,
-        "last_updated": datetime.datetime.now(pytz.timezone('Asia/Ho_Chi_Minh')).strftime("%Y-%m-%d %H:%M:%S")
+        "last_updated": datetime.datetime.now(VN_TZ).strftime("%Y-%m-%d %H:%M:%S")
     }
     
     with open(ALLOWED_CHANNELS_CONFIG_FILE, 'w', encoding='utf-8') as f:
@@ -1146,7 +1474,7 @@ def log_channel_change(action: str, interaction: discord.Interaction, note: str
             "action": action,
             "changed_by": interaction.user.id,
             "changed_by_name": str(interaction.user),
-            "timestamp": datetime.datetime.now(pytz.timezone('Asia/Ho_Chi_Minh')).strftime("%Y-%m-%d %H:%M:%S")
+            "timestamp": datetime.datetime.now(VN_TZ).strftime("%Y-%m-%d %H:%M:%S")
         }
         
         if action == "set_channel":
@@ -1209,7 +1537,7 @@ def save_admin_list(admin_ids: List[int], updated_by: int):
     try:
         admin_data = {
             "admin_user_ids": admin_ids,
-            "last_updated": datetime.datetime.now(pytz.timezone('Asia/Ho_Chi_Minh')).strftime("%Y-%m-%d %H:%M:%S"),
+            "last_updated": datetime.datetime.now(VN_TZ).strftime("%Y-%m-%d %H:%M:%S"),
             "updated_by": updated_by
         }
         
@@ -1245,7 +1573,7 @@ def save_channel_list_message_id(message_id: int):
         config_data = {
             "channel_list_message_id": message_id,
             "channel_list_channel_id": CHANNEL_LIST_DISPLAY_CHANNEL_ID,
-            "last_updated": datetime.datetime.now(pytz.timezone('Asia/Ho_Chi_Minh')).strftime("%Y-%m-%d %H:%M:%S")
+            "last_updated": datetime.datetime.now(VN_TZ).strftime("%Y-%m-%d %H:%M:%S")
         }
         
         with open(CHANNEL_LIST_CONFIG_FILE, 'w', encoding='utf-8') as f:
@@ -1444,7 +1772,7 @@ class GlobalLeaderboardView(discord.ui.View):
         )
         
         # Footer
-        timestamp = datetime.datetime.now(pytz.timezone('Asia/Ho_Chi_Minh')).strftime('%Y-%m-%d %H:%M:%S')
+        timestamp = datetime.datetime.now(VN_TZ).strftime('%Y-%m-%d %H:%M:%S')
         embed.set_footer(text=f"Last updated: {timestamp}")
         
         return embed
@@ -1801,17 +2129,17 @@ async def update_channel_list_message():
             return
         
         # Build the message content
-        current_time = datetime.datetime.now(pytz.timezone('Asia/Ho_Chi_Minh')).strftime("%Y-%m-%d %H:%M:%S")
+        current_time = datetime.datetime.now(VN_TZ).strftime("%Y-%m-%d %H:%M:%S")
         
         embed = discord.Embed(
             title="📋 Bot Allowed Channels Configuration",
             description="**Channels where the bot commands can be used**\n\n"
                        "This list is automatically updated when channels are added or removed.",
             color=discord.Color.blue(),
-            timestamp=datetime.datetime.now(datetime.timezone.utc)
+            timestamp=datetime.datetime.now(UTC_TZ)
         )
         
-        if not config.ALLOWED_CHANNEL_IDS:
+        if not client.restricted_channel_ids:
             embed.add_field(
                 name="🌐 Current Status",
                 value="**No channel restrictions active**\n\n"
@@ -1877,12 +2205,12 @@ async def update_channel_list_message():
                     channels_config = [ch for ch in channels_config if ch.get('channel_id') != ch_to_remove.get('channel_id')]
                 
                 # Update in-memory config
-                config.ALLOWED_CHANNEL_IDS = [ch['channel_id'] for ch in channels_config]
+                client.set_channel_restrictions([ch['channel_id'] for ch in channels_config])
                 
                 # Save to file
                 config_data = {
                     "channels": channels_config,
-                    "last_updated": datetime.datetime.now(pytz.timezone('Asia/Ho_Chi_Minh')).strftime("%Y-%m-%d %H:%M:%S")
+                    "last_updated": datetime.datetime.now(VN_TZ).strftime("%Y-%m-%d %H:%M:%S")
                 }
                 
                 with open(ALLOWED_CHANNELS_CONFIG_FILE, 'w', encoding='utf-8') as f:
@@ -2004,10 +2332,165 @@ async def update_channel_list_message():
 
 
 
+# ============================================================================
+# AUTOCOMPLETE NAME INDEX
+# ============================================================================
+
+AUTOCOMPLETE_MAX_CHOICES = 25  # Discord's limit per autocomplete response
+AUTOCOMPLETE_CACHE_SIZE = 1024  # Memoized (scope, input) results kept by the bot
+
+
+class NameIndex:
+    """Pre-built lookup over a list of names for autocomplete
+    
+    Names are casefolded once at build time. Prefix matches (what users type
+    most) come from a sorted key list via bisect in O(log n); substring
+    matches are only scanned to top up the result when prefixes run short,
+    and a bigram posting list narrows that scan to plausible candidates.
+    While the user keeps typing, each query only re-checks the names that
+    matched the previous one. One Choice object per name is built up front
+    and reused by every search.
+    """
+    
+    __slots__ = ('pairs', 'choices', 'empty_choices', 'sorted_keys', 'sorted_order', 'max_len',
+                 'bigrams', 'last_query', 'last_matches')
+    
+    def __init__(self, names: List[str]):
+        self.pairs = [(name.casefold(), name) for name in names]  # Original order
+        self.choices = [app_commands.Choice(name=name, value=name) for _, name in self.pairs]
+        self.empty_choices = self.choices[:AUTOCOMPLETE_MAX_CHOICES]  # Response before anything is typed
+        self.sorted_order = sorted(range(len(self.pairs)), key=self.pairs.__getitem__)
+        self.sorted_keys = [self.pairs[idx][0] for idx in self.sorted_order]
+        self.max_len = max((len(name_lower) for name_lower, _ in self.pairs), default=0)
+        
+        # {2-char window: [indexes into pairs, ascending]}
+        self.bigrams = {}
+        for idx, (name_lower, _) in enumerate(self.pairs):
+            for bigram in {name_lower[i:i + 2] for i in range(len(name_lower) - 1)}:
+                self.bigrams.setdefault(bigram, []).append(idx)
+        
+        # Last non-empty query and every index containing it (ascending). An index
+        # is replaced rather than mutated on rebuild, so this never goes stale.
+        self.last_query = None
+        self.last_matches = []
+    
+    def _substring_candidates(self, current_lower: str):
+        """Indexes of names that may contain current_lower (verified by the caller)"""
+        if len(current_lower) < 2:
+            return range(len(self.pairs))
+        
+        first = self.bigrams.get(current_lower[:2])
+        last = self.bigrams.get(current_lower[-2:])
+        if not first or not last:
+            return ()
+        return sorted(set(first).intersection(last))  # Keep original order
+    
+    def _containing_indexes(self, current_lower: str) -> List[int]:
+        """All indexes whose name contains current_lower, narrowed from the last query when possible"""
+        if self.last_query is not None and current_lower.startswith(self.last_query):
+            # Anything containing the longer input also contained the shorter one
+            candidates = self.last_matches
+        else:
+            candidates = self._substring_candidates(current_lower)
+        
+        matches = [idx for idx in candidates if current_lower in self.pairs[idx][0]]
+        self.last_query = current_lower
+        self.last_matches = matches
+        return matches
+    
+    def _search_indexes(self, current_lower: str, limit: int) -> List[int]:
+        """Indexes into pairs matching the input: prefix hits first, then substring hits"""
+        if not current_lower:
+            return list(range(min(limit, len(self.pairs))))
+        
+        # Longer than any name - nothing can match
+        if len(current_lower) > self.max_len:
+            return []
+        
+        results = []
+        i = bisect.bisect_left(self.sorted_keys, current_lower)
+        while i < len(self.sorted_keys) and len(results) < limit and self.sorted_keys[i].startswith(current_lower):
+            results.append(self.sorted_order[i])
+            i += 1
+        
+        if len(results) < limit:
+            for idx in self._containing_indexes(current_lower):
+                if not self.pairs[idx][0].startswith(current_lower):
+                    results.append(idx)
+                    if len(results) == limit:
+                        break
+        
+        return results
+    
+    def search(self, current_lower: str, limit: int = AUTOCOMPLETE_MAX_CHOICES) -> List[str]:
+        """Names matching the casefolded input"""
+        return [self.pairs[idx][1] for idx in self._search_indexes(current_lower, limit)]
+    
+    def search_choices(self, current_lower: str, limit: int = AUTOCOMPLETE_MAX_CHOICES) -> List[app_commands.Choice[str]]:
+        """Pooled autocomplete choices matching the casefolded input"""
+        if not current_lower and limit == AUTOCOMPLETE_MAX_CHOICES:
+            return self.empty_choices
+        return [self.choices[idx] for idx in self._search_indexes(current_lower, limit)]
+
+
 # ============================================================================
 # DISCORD BOT CLIENT
 # ============================================================================
 
+ROLE_LIST_FIELDS = ('Leaders', 'Officers')  # Stored in Sheets as JSON arrays of user IDs
+ROLE_SET_KEYS = {'Leaders': '_leaders_set', 'Officers': '_officers_set'}  # O(1) membership, cache-only
+
+
+def parse_role_lists(club_config: dict, fields: Tuple[str, ...] = ROLE_LIST_FIELDS) -> dict:
+    """Parse a club's Leaders/Officers cells into lists of user IDs (in place)
+    
+    Done once when configs enter the cache so commands never re-parse JSON;
+    the lists are only serialized again when written back to Sheets. A set of
+    each list is kept alongside under a '_'-prefixed key, which is never
+    written to the cache files. Pass fields to refresh only some of them.
+    """
+    for role_field in fields:
+        value = club_config.get(role_field)
+        if isinstance(value, str):
+            try:
+                value = loads_role_list(value)
+            except ValueError:  # orjson.JSONDecodeError subclasses it too
+                print(f"Warning: Invalid {role_field} for {club_config.get('Club_Name')}: {value!r}")
+                value = []
+        if not isinstance(value, list):
+            value = []
+        club_config[role_field] = value
+        club_config[ROLE_SET_KEYS[role_field]] = set(value)
+    return club_config
+
+
+# Raw Leaders+Officers cells longer than this are parsed on a worker thread;
+# smaller ones (the common case) are cheaper to parse than a thread hop
+ROLE_LIST_OFFLOAD_CHARS = 512
+
+
+async def parse_role_lists_async(club_config: dict) -> dict:
+    """parse_role_lists, moved off the event loop when the raw cells are large"""
+    raw_len = sum(
+        len(value) for value in map(club_config.get, ROLE_LIST_FIELDS) if isinstance(value, str)
+    )
+    if raw_len < ROLE_LIST_OFFLOAD_CHARS:
+        return parse_role_lists(club_config)
+    return await asyncio.to_thread(parse_role_lists, club_config)
+
+
+def loads_role_list(value: str) -> list:
+    """Parse a Leaders/Officers cell (JSON list of user IDs); blank -> []"""
+    if not value.strip():
+        return []
+    return orjson.loads(value) if orjson else json.loads(value)
+
+
+def dumps_role_list(user_ids: list) -> str:
+    """Serialize a Leaders/Officers list for its Sheets cell"""
+    return orjson.dumps(user_ids).decode() if orjson else json.dumps(user_ids)
+
+
 class ClubManagementBot(discord.Client):
     """Custom Discord client for club management"""
     
@@ -2016,50 +2499,96 @@ class ClubManagementBot(discord.Client):
         self.tree = app_commands.CommandTree(self)
         self.tree.interaction_check = self.global_channel_check
         self.config_cache = {}
+        self.config_cache_lower = {}  # {club_name.lower(): club_name} for duplicate-name checks
+        self.config_cache_sorted = ()  # ((club_name, config), ...) by lowercase name, for /club_list
+        self.config_names = frozenset()  # Snapshot of config_cache keys for duplicate checks before send_modal
         self.member_cache = {}
-        self.last_cache_update_time = 0
-        self.start_time = datetime.datetime.now(datetime.timezone.utc)
+        # Autocomplete indexes derived from config_cache (see _rebuild_server_index)
+        self.clubs_by_server = {}  # {server_id (str): [club_name, ...]}
+        self.all_club_names = []
+        self.club_index_by_server = {}  # {server_id (str): NameIndex}
+        self.club_index_all = NameIndex([])
+        self.member_index_by_club = {}  # {club_name: NameIndex}
+        self.member_index_casefold = {}  # Same indexes keyed by casefolded club name
+        self.member_count_cache = {}  # {club_name: member count} for clubs with members (/club_list)
+        self.leader_index = {}  # {user_id: {club_name, ...}} - reverse of each club's Leaders
+        # Autocomplete results: {(kind, scope, current_lower, version): [Choice, ...]} - LRU ordered
+        self._ac_cache: OrderedDict = OrderedDict()
+        self._ac_cache_version = 0  # Bumped whenever an index is rebuilt
+        # Monotonic clock so NTP adjustments can't bypass or stall the cooldown
+        self._last_cache_update_mono = float('-inf')
+        self.start_time = datetime.datetime.now(UTC_TZ)
+        # {(guild_id, user_id, roles_hash): (is_admin, expires_at)} - LRU ordered
+        self._perm_cache: OrderedDict = OrderedDict()
+        # {user_id: (User, expires_at)} for users fetched over REST - LRU ordered
+        self._fetched_users: OrderedDict = OrderedDict()
+        # {club_name: hash of last serialized config written to disk}
+        self._club_hashes = {}
+        # Channel IDs from the channels file only (config.ALLOWED_CHANNEL_IDS may be
+        # env-seeded); empty = no restrictions, commands are allowed everywhere
+        self.restricted_channel_ids = frozenset()
+        # Background config writes that ran out of retries: {(ws_id, row, col): FailedConfigWrite}
+        self.failed_config_writes = {}
+        # Fetched admin channels reused by background notifications: {channel_id: channel}
+        self._channel_cache = {}
+        self.help_view = None  # Persistent HelpView, created in setup_hook (Views need a running loop)
     
     async def setup_hook(self):
         """Setup hook called when bot is ready"""
         # Sync commands to Discord
         await self.tree.sync()
         print("✅ Commands synced to Discord")
+        
+        # Start the error-log listener thread
+        _log_listener.start()
+        
+        # One stateless HelpView serves every /help message, before and after restarts
+        self.help_view = HelpView()
+        self.add_view(self.help_view)
+        
+        # Single background worker drains command logs in batches
+        self._log_queue = asyncio.Queue(maxsize=COMMAND_LOG_QUEUE_SIZE)
+        self._log_worker_task = asyncio.create_task(self._log_worker())
         # Note: Scheduled tasks start themselves via @tasks.loop decorators
 
     
+    def set_channel_restrictions(self, channel_ids: List[int]):
+        """Apply the channels file's channel IDs to the live channel check
+        
+        Called by every writer of the file (on_ready load, /set_channel, channel
+        list cleanup, God Mode clear); an empty list lifts all restrictions.
+        """
+        self.restricted_channel_ids = frozenset(channel_ids)
+        config.ALLOWED_CHANNEL_IDS = list(channel_ids)
+    
     async def global_channel_check(self, interaction: discord.Interaction) -> bool:
         """Check if command is used in allowed channel"""
         # God mode users bypass all checks
-        if interaction.user.id in config.GOD_MODE_USER_IDS:
+        if interaction.user.id in GOD_MODE_USER_ID_SET:
             # Log command for God mode users too
-            if interaction.type == discord.InteractionType.application_command:
-                asyncio.create_task(self.log_command(interaction))
+            self._maybe_log(interaction)
             return True
         
         # Server administrators bypass channel restrictions
-        if interaction.guild and interaction.user.guild_permissions.administrator:
+        if interaction.guild and self._is_guild_admin(interaction):
             # Log command for admins too
-            if interaction.type == discord.InteractionType.application_command:
-                asyncio.create_task(self.log_command(interaction))
+            self._maybe_log(interaction)
             return True
         
-        # ✅ Load channels config
-        channels_config = load_channels_config()
-        
         # If no restrictions, allow all
-        if not channels_config:
+        # restricted_channel_ids mirrors the channels file (loaded in on_ready, kept
+        # in sync via set_channel_restrictions) - no disk read here
+        if not self.restricted_channel_ids:
             # Log command
-            if interaction.type == discord.InteractionType.application_command:
-                asyncio.create_task(self.log_command(interaction))
+            self._maybe_log(interaction)
             return True
         
         # For autocomplete, fail silently
         if interaction.type == discord.InteractionType.autocomplete:
-            return interaction.channel_id in config.ALLOWED_CHANNEL_IDS
+            return interaction.channel_id in self.restricted_channel_ids
         
         # For commands, check channel and send message if wrong
-        if interaction.channel_id not in config.ALLOWED_CHANNEL_IDS:
+        if interaction.channel_id not in self.restricted_channel_ids:
             try:
                 if not interaction.response.is_done():
                     await interaction.response.send_message(
@@ -2074,62 +2603,127 @@ class ClubManagementBot(discord.Client):
             return False
         
         # Log command (only for actual commands, not autocomplete)
-        if interaction.type == discord.InteractionType.application_command:
-            asyncio.create_task(self.log_command(interaction))
+        self._maybe_log(interaction)
         
         return True
+    
+    def _should_log(self) -> bool:
+        """Whether the logging channel is configured and currently cached
+        
+        Re-checked per command (get_channel is a dict lookup) so a channel that
+        is briefly missing - before the guild cache fills, or while the guild is
+        unavailable - doesn't disable logging for the rest of the process.
+        """
+        return bool(LOGGING_CHANNEL_ID) and self.get_channel(LOGGING_CHANNEL_ID) is not None
+    
+    def _maybe_log(self, interaction: discord.Interaction):
+        """Queue an application command for logging, skipped when there is no log channel"""
+        if interaction.type == discord.InteractionType.application_command and self._should_log():
+            self._enqueue_command_log(interaction)
+    
+    async def get_or_fetch_user(self, user_id: int, guild: Optional[discord.Guild] = None):
+        """Resolve a user from the guild/user caches, hitting the REST API only on a miss
+        
+        Users that share no guild with the bot never enter discord.py's cache, so
+        REST results are kept for FETCHED_USER_CACHE_TTL (repeat approvals/DMs for
+        the same requester then skip the round-trip).
+        """
+        user = (guild and guild.get_member(user_id)) or self.get_user(user_id)
+        if user is not None:
+            return user
+        
+        now = time.monotonic()
+        cached = self._fetched_users.get(user_id)
+        if cached and cached[1] > now:
+            self._fetched_users.move_to_end(user_id)
+            return cached[0]
+        
+        user = await self.fetch_user(user_id)
+        self._fetched_users[user_id] = (user, now + FETCHED_USER_CACHE_TTL)
+        self._fetched_users.move_to_end(user_id)
+        if len(self._fetched_users) > FETCHED_USER_CACHE_MAX_SIZE:
+            self._fetched_users.popitem(last=False)
+        return user
+    
+    def _is_guild_admin(self, interaction: discord.Interaction) -> bool:
+        """Cached check for the administrator permission (keyed on the user's roles)"""
+        user = interaction.user
+        roles_hash = hash(tuple(r.id for r in getattr(user, 'roles', ())))
+        key = (interaction.guild_id, user.id, roles_hash)
+        now = time.monotonic()
+        
+        cached = self._perm_cache.get(key)
+        if cached and cached[1] > now:
+            self._perm_cache.move_to_end(key)
+            return cached[0]
         
-    async def log_command(self, interaction: discord.Interaction):
-        """Log all commands to logging channel"""
         try:
-            # Get command name and parameters
-            command_name = interaction.command.name if interaction.command else "Unknown"
-            
-            # Build parameters string
-            params = []
-            if interaction.namespace:
-                for key, value in interaction.namespace.__dict__.items():
-                    if not key.startswith('_'):
-                        # Format user mentions
-                        if isinstance(value, discord.Member) or isinstance(value, discord.User):
-                            params.append(f"{key}=@{value.name}")
-                        else:
-                            params.append(f"{key}={value}")
+            is_admin = user.guild_permissions.administrator
+        except (AttributeError, TypeError):
+            is_admin = False
+        
+        self._perm_cache[key] = (is_admin, now + PERMISSION_CACHE_TTL)
+        self._perm_cache.move_to_end(key)
+        if len(self._perm_cache) > PERMISSION_CACHE_MAX_SIZE:
+            self._perm_cache.popitem(last=False)
+        return is_admin
+    
+    def _enqueue_command_log(self, interaction: discord.Interaction):
+        """Queue a command for the log worker, dropping the oldest entry when full"""
+        item = (time.time(), interaction)
+        try:
+            self._log_queue.put_nowait(item)
+        except asyncio.QueueFull:
+            self._log_queue.get_nowait()
+            self._log_queue.put_nowait(item)
+    
+    async def _log_worker(self):
+        """Drain queued commands and send them to the logging channel in batches"""
+        while True:
+            batch = [await self._log_queue.get()]
             
-            params_str = ", ".join(params) if params else "No parameters"
+            # Give bursts a moment to accumulate so they share one message
+            await asyncio.sleep(COMMAND_LOG_BATCH_WINDOW)
+            while len(batch) < COMMAND_LOG_BATCH_SIZE and not self._log_queue.empty():
+                batch.append(self._log_queue.get_nowait())
             
-            # Create embed
+            await self.log_command(batch)
+    
+    async def log_command(self, batch: List[Tuple[float, discord.Interaction]]):
+        """Log a batch of commands to logging channel as a single embed"""
+        try:
             embed = discord.Embed(
-                title=f"📝 Command Executed: /{command_name}",
+                title=f"📝 Commands Executed ({len(batch)})",
                 color=discord.Color.blue(),
-                timestamp=datetime.datetime.now(datetime.timezone.utc)
-            )
-            
-            embed.add_field(
-                name="User",
-                value=f"{interaction.user.mention} (`{interaction.user.name}` - ID: {interaction.user.id})",
-                inline=False
-            )
-            
-            embed.add_field(
-                name="Channel",
-                value=f"<#{interaction.channel_id}> (ID: {interaction.channel_id})",
-                inline=True
+                timestamp=datetime.datetime.now(UTC_TZ)
             )
             
-            if interaction.guild:
+            for queued_at, interaction in batch:
+                # Get command name and parameters
+                command_name = interaction.command.name if interaction.command else "Unknown"
+                
+                # Build parameters string (user mentions shown as @name)
+                params_str = ", ".join(
+                    f"{key}=@{value.name}" if isinstance(value, (discord.Member, discord.User)) else f"{key}={value}"
+                    for key, value in vars(interaction.namespace).items()
+                    if not key.startswith('_')
+                ) if interaction.namespace else ""
+                params_str = params_str or "No parameters"
+                
+                location = f"<#{interaction.channel_id}> (ID: {interaction.channel_id})"
+                if interaction.guild:
+                    location += f"\n**Server:** {interaction.guild.name} (ID: {interaction.guild_id})"
+                
                 embed.add_field(
-                    name="Server",
-                    value=f"{interaction.guild.name} (ID: {interaction.guild_id})",
-                    inline=True
+                    name=f"/{command_name} • <t:{int(queued_at)}:T>",
+                    value=(
+                        f"**User:** {interaction.user.mention} (`{interaction.user.name}` - ID: {interaction.user.id})\n"
+                        f"**Channel:** {location}\n"
+                        f"```{params_str[:200]}```"
+                    ),
+                    inline=False
                 )
             
-            embed.add_field(
-                name="Parameters",
-                value=f"```{params_str}```",
-                inline=False
-            )
-            
             # Send to logging channel
             await send_log_to_channel(embed)
         
@@ -2151,27 +2745,30 @@ class ClubManagementBot(discord.Client):
                 print(f"Warning: Club '{club_name}' not in cache, cannot update")
                 return False
             
-            # Update in-memory cache
-            for field, value in field_updates.items():
-                self.config_cache[club_name][field] = value
-            
-            # Also update the serializable cache file
-            config_cache_file = os.path.join(SCRIPT_DIR, "cache", "config_cache.json")
-            if os.path.exists(config_cache_file):
-                try:
-                    with open(config_cache_file, 'r', encoding='utf-8') as f:
-                        saved_cache = json.load(f)
-                    
-                    if club_name in saved_cache:
-                        for field, value in field_updates.items():
-                            saved_cache[club_name][field] = value
-                        
-                        with open(config_cache_file, 'w', encoding='utf-8') as f:
-                            json.dump(saved_cache, f, ensure_ascii=False, indent=2)
-                        
-                        print(f"Cache file updated for {club_name}: {field_updates}")
-                except Exception as e:
-                    print(f"Warning: Could not update cache file: {e}")
+            # Update the cached dict in place (readers keep the same object;
+            # nothing here awaits, so no one sees a half-applied update)
+            club_config = self.config_cache[club_name]
+            club_config.update(field_updates)
+            # Only the role fields that changed are re-derived
+            changed_roles = tuple(f for f in ROLE_LIST_FIELDS if f in field_updates)
+            if changed_roles:
+                parse_role_lists(club_config, changed_roles)
+                if 'Leaders' in field_updates:
+                    self._rebuild_leader_index()
+            # Club names never change here, so the indexes only move with Server_ID
+            if 'Server_ID' in field_updates:
+                self._rebuild_server_index()
+            
+            # Also update this club's cache file (other clubs are untouched)
+            try:
+                serializable = {
+                    k: v for k, v in club_config.items()
+                    if k != 'config_sheet' and not k.startswith('_')
+                }
+                if self._write_club_cache_file(club_name, serializable):
+                    print(f"Cache file updated for {club_name}: {field_updates}")
+            except Exception as e:
+                print(f"Warning: Could not update cache file: {e}")
             
             print(f"Config cache updated for {club_name}: {field_updates}")
             return True
@@ -2180,18 +2777,28 @@ class ClubManagementBot(discord.Client):
             print(f"Error updating single club config: {e}")
             return False
     
-    async def update_caches(self):
-        """Update config and member caches from Google Sheets"""
-        current_time = time.time()
+    async def update_caches(self, force: bool = False):
+        """Update config and member caches from Google Sheets
+        
+        force=True skips the cooldown, for callers that just changed the sheet
+        and need the reload (e.g. a newly created club).
+        """
+        current_time = time.monotonic()
         
         # Check cooldown
-        if current_time - self.last_cache_update_time < config.CACHE_UPDATE_COOLDOWN:
+        if not force and current_time - self._last_cache_update_mono < config.CACHE_UPDATE_COOLDOWN:
             print("Bot: Cache update skipped (cooldown active).")
             return
         
         try:
             print("Bot: Attempting to update cache from Google Sheets...")
-            config_ws = await asyncio.to_thread(gs_manager.sh.worksheet, config.CONFIG_SHEET_NAME)
+            # Land (or give up on) failed write-throughs before Sheets replaces the cache
+            await retry_failed_config_writes()
+            # Resolve every worksheet handle in one API call and reuse them below
+            all_ws = {ws.title: ws for ws in await asyncio.to_thread(gs_manager.sh.worksheets)}
+            config_ws = all_ws.get(config.CONFIG_SHEET_NAME)
+            if config_ws is None:
+                config_ws = await asyncio.to_thread(gs_manager.sh.worksheet, config.CONFIG_SHEET_NAME)
             club_configs = await asyncio.to_thread(config_ws.get_all_records)
             
             new_config_cache = {}
@@ -2214,15 +2821,19 @@ class ClubManagementBot(discord.Client):
                 
                 club_config['row'] = config_cell.row
                 club_config['config_sheet'] = config_ws
+                await parse_role_lists_async(club_config)
                 
                 new_config_cache[club_name] = club_config
                 serializable_config[club_name] = {
-                    k: v for k, v in club_config.items() if k != 'config_sheet'
+                    k: v for k, v in club_config.items()
+                    if k != 'config_sheet' and not k.startswith('_')
                 }
                 
                 # Load members from DATA SHEET (has actual data with all members)
                 # instead of Members sheet which may be outdated
-                member_names = await self._load_members_from_data_sheet(data_sheet_name)
+                member_names = await self._load_members_from_data_sheet(
+                    data_sheet_name, all_ws.get(data_sheet_name)
+                )
                 new_member_cache[club_name] = member_names
                 total_members += len(member_names)
                 
@@ -2233,12 +2844,14 @@ class ClubManagementBot(discord.Client):
             # Update caches
             self.config_cache = new_config_cache
             self.member_cache = new_member_cache
+            self._rebuild_server_index()
+            self._rebuild_member_index()
             
             # Save to files
             self._save_cache_files(serializable_config, new_member_cache)
             
             print(f"Cache updated: {len(self.config_cache)} clubs, {total_members} members.")
-            self.last_cache_update_time = time.time()
+            self._last_cache_update_mono = time.monotonic()
         
         except Exception as e:
             await self._handle_cache_error(e)
@@ -2257,9 +2870,8 @@ class ClubManagementBot(discord.Client):
                     return []
                 
                 # Check if first row is the === CURRENT === header and skip it
-                header_row_idx = 0
-                if all_values[0] and all_values[0][0] and '=== CURRENT' in all_values[0][0]:
-                    header_row_idx = 1  # Skip CURRENT header row
+                first_cell = all_values[0][0] if all_values[0] else ""
+                header_row_idx = 1 if first_cell.startswith('=== CURRENT') else 0  # Skip CURRENT header row
                 
                 if len(all_values) <= header_row_idx:
                     print(f"Warning: Sheet '{members_sheet_name}' has no data rows")
@@ -2313,13 +2925,19 @@ class ClubManagementBot(discord.Client):
         
         return []
     
-    async def _load_members_from_data_sheet(self, data_sheet_name: str) -> List[str]:
-        """Load unique member names from Data Sheet (has actual stats data)"""
+    async def _load_members_from_data_sheet(self, data_sheet_name: str, data_ws=None) -> List[str]:
+        """Load unique member names from Data Sheet (has actual stats data)
+        
+        Args:
+            data_sheet_name: Name of the data sheet
+            data_ws: Already-resolved worksheet handle (skips a worksheet() lookup)
+        """
         max_retries = 3
         
         for attempt in range(max_retries):
             try:
-                data_ws = await asyncio.to_thread(gs_manager.sh.worksheet, data_sheet_name)
+                if data_ws is None:
+                    data_ws = await asyncio.to_thread(gs_manager.sh.worksheet, data_sheet_name)
                 all_values = await asyncio.to_thread(data_ws.get_all_values)
                 
                 if not all_values or len(all_values) < 1:
@@ -2327,9 +2945,8 @@ class ClubManagementBot(discord.Client):
                     return []
                 
                 # Check if first row is the === CURRENT === header and skip it
-                header_row_idx = 0
-                if all_values[0] and all_values[0][0] and '=== CURRENT' in all_values[0][0]:
-                    header_row_idx = 1  # Skip CURRENT header row
+                first_cell = all_values[0][0] if all_values[0] else ""
+                header_row_idx = 1 if first_cell.startswith('=== CURRENT') else 0  # Skip CURRENT header row
                 
                 if len(all_values) <= header_row_idx:
                     print(f"Warning: Data Sheet '{data_sheet_name}' has no data rows")
@@ -2382,14 +2999,138 @@ class ClubManagementBot(discord.Client):
         
         return []
     
+    def _rebuild_server_index(self):
+        """Rebuild the per-server club name index used by club_autocomplete
+        (and the lowercase name lookup used by the setup modals)
+        
+        Must be called whenever config_cache is replaced or a club is modified.
+        """
+        clubs_by_server = defaultdict(list)
+        for name, club_config in self.config_cache.items():
+            server_id = club_config.get('Server_ID')
+            if server_id:
+                clubs_by_server[str(server_id)].append(name)
+        
+        self.clubs_by_server = dict(clubs_by_server)
+        self.all_club_names = list(self.config_cache.keys())
+        self.config_names = frozenset(self.all_club_names)
+        self.config_cache_lower = {name.lower(): name for name in self.all_club_names}
+        # Configs are updated in place, so this only goes stale when the cache is replaced
+        self.config_cache_sorted = tuple(
+            (name, self.config_cache[name]) for name in sorted(self.all_club_names, key=str.lower)
+        )
+        
+        # Fold case and sort once here instead of on every keystroke
+        self.club_index_by_server = {
+            server_id: NameIndex(names) for server_id, names in self.clubs_by_server.items()
+        }
+        self.club_index_all = NameIndex(self.all_club_names)
+        self._ac_cache_version += 1
+        self._rebuild_leader_index()
+    
+    def _rebuild_leader_index(self):
+        """Rebuild leader_index ({user_id: {club_name, ...}}) used by permission checks
+        
+        Must be called whenever a club's Leaders change.
+        """
+        leader_index = defaultdict(set)
+        for name, club_config in self.config_cache.items():
+            for user_id in club_config['_leaders_set']:
+                leader_index[user_id].add(name)
+        self.leader_index = dict(leader_index)
+    
+    def _rebuild_member_index(self):
+        """Rebuild the per-club member name indexes used by member_autocomplete
+        
+        Must be called whenever member_cache is replaced.
+        """
+        self.member_index_by_club = {
+            club_name: NameIndex(members) for club_name, members in self.member_cache.items()
+        }
+        self.member_index_casefold = {
+            club_name.casefold(): index for club_name, index in self.member_index_by_club.items()
+        }
+        self.member_count_cache = {
+            club_name: len(members) for club_name, members in self.member_cache.items() if members
+        }
+        self._ac_cache_version += 1
+    
+    def get_cached_autocomplete(self, key: tuple) -> Optional[list]:
+        """Previously built autocomplete choices for key, if still current"""
+        choices = self._ac_cache.get(key + (self._ac_cache_version,))
+        if choices is not None:
+            self._ac_cache.move_to_end(key + (self._ac_cache_version,))
+        return choices
+    
+    def cache_autocomplete(self, key: tuple, choices: list):
+        """Remember autocomplete choices for key (evicts least recently used)"""
+        self._ac_cache[key + (self._ac_cache_version,)] = choices
+        if len(self._ac_cache) > AUTOCOMPLETE_CACHE_SIZE:
+            self._ac_cache.popitem(last=False)
+    
+    @staticmethod
+    def _club_cache_filename(club_name: str) -> str:
+        """Stable per-club cache filename (club names may contain any character)"""
+        return hashlib.sha1(club_name.encode('utf-8')).hexdigest()[:16] + ".json"
+    
+    def _write_club_cache_file(self, club_name: str, club_config: dict) -> bool:
+        """Write one club's config to disk if it changed since the last write
+        
+        Returns:
+            True if the file was written, False if it was already up to date
+        """
+        serialized = json.dumps(club_config, sort_keys=True)
+        new_hash = hash(serialized)
+        if self._club_hashes.get(club_name) == new_hash:
+            return False
+        
+        with open(os.path.join(CLUB_CACHE_DIR, self._club_cache_filename(club_name)), "w") as f:
+            f.write(serialized)
+        self._club_hashes[club_name] = new_hash
+        return True
+    
     def _save_cache_files(self, config_data: dict, member_data: dict):
-        """Save cache data to files"""
+        """Save cache data to files (only clubs whose config changed are rewritten)"""
         print("Writing to local cache files...")
-        with open(CONFIG_CACHE_FILE, "w") as f:
-            json.dump(config_data, f)
+        written = sum(
+            self._write_club_cache_file(name, club_config)
+            for name, club_config in config_data.items()
+        )
+        
+        # Drop files for clubs that no longer exist and refresh the index
+        removed = set(self._club_hashes) - set(config_data)
+        for name in removed:
+            del self._club_hashes[name]
+            try:
+                os.remove(os.path.join(CLUB_CACHE_DIR, self._club_cache_filename(name)))
+            except FileNotFoundError:
+                pass
+        
+        if written or removed or not os.path.exists(CLUB_CACHE_INDEX_FILE):
+            with open(CLUB_CACHE_INDEX_FILE, "w") as f:
+                json.dump({name: self._club_cache_filename(name) for name in config_data}, f)
+        
         with open(MEMBER_CACHE_FILE, "w") as f:
             json.dump(member_data, f)
-        print("Local cache files updated.")
+        print(f"Local cache files updated ({written} club file(s) rewritten).")
+    
+    def _load_config_cache_files(self) -> dict:
+        """Load club configs from the per-club cache files (legacy single file as fallback)"""
+        if not os.path.exists(CLUB_CACHE_INDEX_FILE):
+            with open(CONFIG_CACHE_FILE, 'r') as f:
+                return json.load(f)
+        
+        with open(CLUB_CACHE_INDEX_FILE, 'r') as f:
+            index = json.load(f)
+        
+        config_from_cache = {}
+        for name, filename in index.items():
+            try:
+                with open(os.path.join(CLUB_CACHE_DIR, filename), 'r') as f:
+                    config_from_cache[name] = json.load(f)
+            except (FileNotFoundError, json.JSONDecodeError) as e:
+                print(f"Warning: Skipping cached config for {name}: {e}")
+        return config_from_cache
     
     async def _handle_cache_error(self, e: Exception):
         """Handle cache update errors by loading from files"""
@@ -2398,8 +3139,9 @@ class ClubManagementBot(discord.Client):
             print("--- Loading from local cache files instead... ---")
             
             try:
-                with open(CONFIG_CACHE_FILE, 'r') as f:
-                    config_from_cache = json.load(f)
+                config_from_cache = self._load_config_cache_files()
+                for club_config in config_from_cache.values():
+                    await parse_role_lists_async(club_config)  # Older cache files hold the raw JSON strings
                 with open(MEMBER_CACHE_FILE, 'r') as f:
                     self.member_cache = json.load(f)
                 
@@ -2411,6 +3153,8 @@ class ClubManagementBot(discord.Client):
                         self.config_cache[name] = club_config
                 except Exception:
                     self.config_cache = config_from_cache
+                self._rebuild_server_index()
+                self._rebuild_member_index()
                 
                 print(f"Loaded {len(self.config_cache)} clubs from cache.")
             
@@ -2503,6 +3247,10 @@ async def before_auto_sync():
 
 def migrate_old_channel_config():
     """Migrate old single-channel config to new multi-channel format"""
+    # Already migrated on a previous run - nothing to do
+    if os.path.exists(CHANNEL_CONFIG_MIGRATED_FILE):
+        return False
+    
     old_file = os.path.join(SCRIPT_DIR, "allowed_channel_config.json")
     new_file = ALLOWED_CHANNELS_CONFIG_FILE
     
@@ -2521,9 +3269,9 @@ def migrate_old_channel_config():
                     "server_name": old_data.get('server_name', 'Unknown'),
                     "added_by": old_data.get('set_by'),
                     "added_by_name": old_data.get('set_by_name', 'Unknown'),
-                    "added_at": old_data.get('set_at', datetime.datetime.now(pytz.timezone('Asia/Ho_Chi_Minh')).strftime("%Y-%m-%d %H:%M:%S"))
+                    "added_at": old_data.get('set_at', datetime.datetime.now(VN_TZ).strftime("%Y-%m-%d %H:%M:%S"))
                 }],
-                "last_updated": datetime.datetime.now(pytz.timezone('Asia/Ho_Chi_Minh')).strftime("%Y-%m-%d %H:%M:%S")
+                "last_updated": datetime.datetime.now(VN_TZ).strftime("%Y-%m-%d %H:%M:%S")
             }
             
             # Save new format
@@ -2534,6 +3282,9 @@ def migrate_old_channel_config():
             backup_file = old_file + '.backup'
             os.rename(old_file, backup_file)
             
+            # Mark migration done so later restarts skip the file checks
+            open(CHANNEL_CONFIG_MIGRATED_FILE, 'w').close()
+            
             print(f"✅ Migrated channel config from old format to new format")
             print(f"   Old file backed up to: {backup_file}")
             
@@ -2551,11 +3302,6 @@ def migrate_old_channel_config():
 @client.event
 async def on_ready():
     """Called when bot is ready"""    
-    # Start background cleanup task
-    if not cleanup_expired_requests.is_running():
-        cleanup_expired_requests.start()
-        print("✅ Started cleanup_expired_requests background task")
-    
     # Start auto-sync task
     if not auto_sync_to_supabase.is_running():
         auto_sync_to_supabase.start()
@@ -2582,7 +3328,7 @@ async def on_ready():
     # Load channel configuration
     channels_config = load_channels_config()
     if channels_config:
-        config.ALLOWED_CHANNEL_IDS = [ch['channel_id'] for ch in channels_config]
+        client.set_channel_restrictions([ch['channel_id'] for ch in channels_config])
         print(f"✅ Channel restrictions active: {len(config.ALLOWED_CHANNEL_IDS)} channel(s)")
         for ch in channels_config:
             print(f"   - {ch['channel_name']} in {ch['server_name']} (ID: {ch['channel_id']})")
@@ -2676,41 +3422,37 @@ async def club_autocomplete(
         
         # Filter clubs by current server - fast path
         server_id = interaction.guild_id
-        current_lower = current.lower() if current else ""
+        current_lower = current.casefold() if current else ""
         
-        # Fast path: If no server ID (DM), show all clubs
         if not server_id:
-            choices = [
-                app_commands.Choice(name=name, value=name)
-                for name in list(client.config_cache.keys())[:25]
-                if not current_lower or current_lower in name.lower()
-            ]
-            return choices[:25]
+            # Fast path: If no server ID (DM), show all clubs
+            index = client.club_index_all
+        else:
+            # Filter by server - single lookup in the pre-built index
+            # Fallback: If no clubs for this server yet, show all (for setup phase)
+            index = client.club_index_by_server.get(str(server_id)) or client.club_index_all
         
-        # Filter by server - use pre-built list for speed
-        server_clubs = [
-            name for name, config in client.config_cache.items()
-            if config.get('Server_ID') == str(server_id) or config.get('Server_ID') == server_id
-        ]
+        # Nothing typed yet - list precomputed when the index was built
+        if not current_lower:
+            return index.empty_choices
         
-        # Fallback: If no clubs for this server yet, show all (for setup phase)
-        if not server_clubs:
-            server_clubs = list(client.config_cache.keys())
+        # Same server + same input across users/keystrokes -> reuse the result
+        cache_key = ('club', server_id, current_lower)
+        choices = client.get_cached_autocomplete(cache_key)
+        if choices is not None:
+            return choices
         
-        # Filter by user input - limit iterations
-        choices = [
-            app_commands.Choice(name=name, value=name)
-            for name in server_clubs[:50]  # Limit source list
-            if not current_lower or current_lower in name.lower()
-        ]
-        return choices[:25]
+        # Filter by user input - prefix lookup, topped up with substring matches
+        choices = index.search_choices(current_lower)
+        client.cache_autocomplete(cache_key, choices)
+        return choices
         
     except asyncio.CancelledError:
         # Interaction was cancelled (timeout) - return empty silently
         return []
-    except Exception as e:
+    except Exception:
         # Log but don't raise - prevents Unknown interaction errors
-        print(f"Error in club_autocomplete: {e}")
+        logger.exception("club_autocomplete failed")
         return []
 
 
@@ -2725,36 +3467,35 @@ async def member_autocomplete(
         if not club_name or not client.member_cache:
             return []
         
-        # Find club (case-insensitive) using cached data only
-        member_list = client.member_cache.get(club_name, [])
-        
-        if not member_list:
-            # Fast case-insensitive lookup
-            club_name_lower = club_name.casefold()
-            for cached_club, members in client.member_cache.items():
-                if cached_club.casefold() == club_name_lower:
-                    member_list = members
-                    break
+        # Find club (exact, then case-insensitive) using cached data only
+        member_index = (
+            client.member_index_by_club.get(club_name)
+            or client.member_index_casefold.get(club_name.casefold())
+        )
         
-        if not member_list:
+        if not member_index:
             return []
         
-        # Filter and return choices - limit source list for speed
-        current_lower = current.lower() if current else ""
-        choices = [
-            app_commands.Choice(name=name, value=name)
-            for name in member_list[:100]  # Limit source to prevent slowdown
-            if not current_lower or current_lower in name.lower()
-        ]
+        current_lower = current.casefold() if current else ""
+        if not current_lower:
+            return member_index.empty_choices
+        
+        cache_key = ('member', club_name, current_lower)
+        choices = client.get_cached_autocomplete(cache_key)
+        if choices is not None:
+            return choices
         
-        return choices[:25]
+        # Filter and return choices - prefix lookup, topped up with substring matches
+        choices = member_index.search_choices(current_lower)
+        client.cache_autocomplete(cache_key, choices)
+        return choices
     
     except asyncio.CancelledError:
         # Interaction was cancelled (timeout) - return empty silently
         return []
-    except Exception as e:
+    except Exception:
         # Log but don't raise - prevents Unknown interaction errors
-        print(f"Error in member_autocomplete: {e}")
+        logger.exception("member_autocomplete failed")
         return []
 
 
@@ -2769,25 +3510,30 @@ async def on_message(message):
     if message.author.bot:
         return
     
-    # Only process DMs
-    if not isinstance(message.channel, discord.DMChannel):
+    # Only process DMs (enum identity check - on_message fires for every guild message too)
+    if message.channel.type is not discord.ChannelType.private:
         return
     
     user_id = message.author.id
     
+    # Most DMs come from users with nothing pending
+    if user_id not in pending_verifications and user_id not in pending_requests:
+        return
+    
     # ========== PROFILE VERIFICATION HANDLER ==========
     if user_id in pending_verifications:
         verification = pending_verifications[user_id]
         
         # Check if expired
-        if datetime.datetime.now(datetime.timezone.utc) > verification['expires']:
-            del pending_verifications[user_id]
+        if time.time() > verification.expires_ts:
+            remove_pending_verification(user_id)
             await message.reply("⏰ Verification expired. Please use `/stats` again to start a new verification.")
             return
         
         # Check if user wants to cancel
-        if message.content.strip().lower() == 'cancel':
-            del pending_verifications[user_id]
+        content = message.content
+        if len(content) <= CANCEL_WORD_MAX_LEN and content.strip().lower() in CANCEL_WORDS:
+            remove_pending_verification(user_id)
             await message.reply("❌ **Profile verification cancelled.**\n\nYou can link your profile anytime by using `/stats` on your own profile.")
             return
         
@@ -2802,55 +3548,85 @@ async def on_message(message):
             await message.reply("📸 Please send an **image** file (PNG, JPG, etc.).")
             return
         
+        # One screenshot at a time per user
+        if user_id in _ocr_inflight:
+            await message.reply("⏳ Already processing your previous screenshot, please wait...")
+            return
+        
         # Process the image
+        _ocr_inflight.add(user_id)
         try:
             processing_msg = await message.reply("⏳ Processing your screenshot...")
             image_data = await attachment.read()
-            ocr_result = await call_ocr_service(image_data)
+            image_hash = hashlib.blake2b(image_data, digest_size=16).digest()
+            ocr_result = _ocr_cache.get(image_hash)
+            if ocr_result is not None:
+                _ocr_cache.move_to_end(image_hash)
+            else:
+                try:
+                    async with _ocr_sem:
+                        ocr_result = await asyncio.wait_for(call_ocr_service(image_data), timeout=OCR_TIMEOUT)
+                except asyncio.TimeoutError:
+                    logger.warning("OCR service timed out after %ss for user %s", OCR_TIMEOUT, user_id)
+                    ocr_result = {}
+                # Only cache real reads so a transient failure can be retried
+                if ocr_result:
+                    _ocr_cache[image_hash] = ocr_result
+                    if len(_ocr_cache) > _OCR_CACHE_MAX:
+                        _ocr_cache.popitem(last=False)
             
             if not ocr_result or not ocr_result.get('trainer_id'):
                 await processing_msg.edit(content="❌ **Could not read Trainer ID from image.**\n\nPlease make sure the screenshot clearly shows your Trainer ID (12-digit number).")
-                del pending_verifications[user_id]
+                remove_pending_verification(user_id)
                 return
             
             extracted_id = ocr_result.get('trainer_id', '').replace(' ', '')
             extracted_club = ocr_result.get('club', 'Unknown')
             
-            save_profile_link(
-                discord_id=user_id,
-                trainer_id=extracted_id,
-                member_name=verification['member_name'],
-                club_name=verification['club_name']
-            )
-            
-            await processing_msg.edit(
-                content=(
-                    f"✅ **Verification successful!**\n\n"
-                    f"Your Discord account has been linked to:\n"
-                    f"**Trainer ID:** `{extracted_id}`\n"
-                    f"**Club:** {extracted_club}\n"
-                    f"**Member Name:** {verification['member_name']}\n\n"
-                    f"When you use `/profile` in the future, we'll know this is your profile!"
+            async def finish_verification():
+                await asyncio.to_thread(
+                    save_profile_link,
+                    user_id,
+                    extracted_id,
+                    verification.member_name,
+                    verification.club_name
                 )
-            )
-            del pending_verifications[user_id]
+                
+                await processing_msg.edit(
+                    content=(
+                        f"✅ **Verification successful!**\n\n"
+                        f"Your Discord account has been linked to:\n"
+                        f"**Trainer ID:** `{extracted_id}`\n"
+                        f"**Club:** {extracted_club}\n"
+                        f"**Member Name:** {verification.member_name}\n\n"
+                        f"When you use `/profile` in the future, we'll know this is your profile!"
+                    )
+                )
+                remove_pending_verification(user_id)
+            
+            # Once the link is being saved, finish and tell the user even if this handler is cancelled
+            await asyncio.shield(finish_verification())
             
+        except asyncio.CancelledError:
+            logger.warning("Profile verification handler cancelled for user %s", user_id)
+            raise
         except Exception as e:
-            print(f"Profile verification error: {e}")
-            if user_id in pending_verifications:
-                del pending_verifications[user_id]
+            logger.exception("Profile verification failed for user %s", user_id)
+            remove_pending_verification(user_id)
             try:
                 await message.reply(f"❌ Error processing verification: {e}")
             except:
                 pass
+        finally:
+            _ocr_inflight.discard(user_id)
         return
     
     # ========== CUSTOM NAME REQUEST HANDLER ==========
     # Check if user has pending custom name request
-    if message.author.id in pending_requests:
-        request_data = pending_requests[message.author.id]
+    if user_id in pending_requests:
+        request_data = pending_requests[user_id]
         
-        if request_data.get('awaiting_custom_name'):
+        if request_data.awaiting_custom_name:
             custom_name = message.content.strip()
             
             # Validate custom name
@@ -2858,7 +3634,7 @@ async def on_message(message):
                 await message.reply("❌ Name cannot be empty. Please try again.")
                 return
             
-            if custom_name in client.config_cache:
+            if custom_name in client.config_names:
                 await message.reply(
                     f"❌ The name \"{custom_name}\" is also taken. "
                     f"Please choose a different name."
@@ -2874,24 +3650,24 @@ async def on_message(message):
             try:
                 await auto_create_club_from_api(
                     custom_name,
-                    request_data['api_data'],
-                    request_data['club_data'],
+                    request_data.api_data,
+                    request_data.club_data,
                     None
                 )
                 
                 # Notify requester
                 await message.reply(
                     f"✅ **Club created successfully!**\n\n"
-                    f"**Original Name:** {request_data['original_name']}\n"
+                    f"**Original Name:** {request_data.original_name}\n"
                     f"**Custom Name:** {custom_name}\n\n"
                     f"You can now use `/leaderboard {custom_name}` and other commands."
                 )
                 
                 # Notify admin channel
-                channel = await client.fetch_channel(request_data['admin_channel_id'])
+                channel = await client.fetch_channel(request_data.admin_channel_id)
                 await channel.send(
                     f"✅ **Club created with custom name**\n\n"
-                    f"**Original Name:** {request_data['original_name']}\n"
+                    f"**Original Name:** {request_data.original_name}\n"
                     f"**Custom Name:** {custom_name}\n"
                     f"**Requester:** <@{message.author.id}>"
                 )
@@ -2901,59 +3677,83 @@ async def on_message(message):
             
             finally:
                 # Clean up pending request
-                del pending_requests[message.author.id]
+                remove_pending_request(message.author.id)
 
 
 # ============================================================================
-# BACKGROUND TASK: CLEANUP EXPIRED REQUESTS
+# PENDING REQUEST EXPIRY
 # ============================================================================
 
 from discord.ext import tasks
 
-@tasks.loop(minutes=1)
-async def cleanup_expired_requests():
-    """Clean up pending requests after 5 minutes"""
-    current_time = time.time()
-    expired = []
+async def _expire_request(user_id: int):
+    """Drop a custom name request nobody answered within 5 minutes and notify both sides"""
+    data = pending_requests.pop(user_id, None)
+    if data is None:
+        return
     
-    for user_id, data in pending_requests.items():
-        if current_time - data['timestamp'] > 300:  # 5 minutes
-            expired.append(user_id)
+    async def notify_requester():
+        user = await client.get_or_fetch_user(user_id)
+        await user.send(
+            "⏱️ **Request timed out**\n\n"
+            "Your custom name request has expired. "
+            "Please use `/search_club` again if you still want to add this club."
+        )
     
-    for user_id in expired:
-        data = pending_requests.pop(user_id)
-        
-        # Notify requester
-        try:
-            user = await client.fetch_user(user_id)
-            await user.send(
-                "⏱️ **Request timed out**\n\n"
-                "Your custom name request has expired. "
-                "Please use `/search_club` again if you still want to add this club."
-            )
-        except:
-            pass
-        
-        # Notify admin channel
-        try:
-            channel = await client.fetch_channel(data['admin_channel_id'])
-            await channel.send(
-                f"⏱️ **Request timed out**\n\n"
-                f"Club: {data['original_name']}\n"
-                f"Requester: <@{user_id}> did not respond within 5 minutes."
-            )
-        except:
-            pass
+    async def notify_admin_channel():
+        channel = client._channel_cache.get(data.admin_channel_id)
+        if channel is None:
+            channel = await client.fetch_channel(data.admin_channel_id)
+            client._channel_cache[data.admin_channel_id] = channel
+        await channel.send(
+            f"⏱️ **Request timed out**\n\n"
+            f"Club: {data.original_name} - Requester: <@{user_id}>\n"
+            f"Did not respond within 5 minutes."
+        )
+    
+    # Failures are ignored
+    await asyncio.gather(notify_requester(), notify_admin_channel(), return_exceptions=True)
+
 
-# Note: cleanup_expired_requests.start() should be called in on_ready event
+async def _expire_verification(user_id: int):
+    """Drop a profile verification nobody answered within 5 minutes"""
+    if pending_verifications.pop(user_id, None) is None:
+        return
+    try:
+        user = await client.get_or_fetch_user(user_id)
+        await user.send("⏰ Verification expired. Please use `/stats` again to start a new verification.")
+    except Exception:
+        pass
 
 
 # ============================================================================
 # CLUB SETUP MODALS
 # ============================================================================
 
-def extract_club_id_from_url(url: str) -> str:
-    """
+# Club ID at the end of a URL: 9 digits, falling back to any 6-12 digit number
+# (anchored with \Z rather than a `\D*$|$` alternation)
+_CLUB_ID_RE_9 = re.compile(r'(\d{9})\D*\Z')
+_CLUB_ID_RE_FALLBACK = re.compile(r'(\d{6,12})\D*\Z')
+
+# Characters Google Sheets does not allow in tab names (display order kept for error messages)
+_INVALID_CLUB_CHARS_DISPLAY = ('/', '\\', '?', '*', ':', '[', ']')
+_INVALID_CLUB_CHARS = frozenset(_INVALID_CLUB_CHARS_DISPLAY)
+_INVALID_CLUB_CHARS_TABLE = str.maketrans('', '', ''.join(_INVALID_CLUB_CHARS_DISPLAY))  # Deletes them
+
+# Accepted club URL schemes
+_HTTP_PREFIXES = ('http://', 'https://')
+
+# "Where is my Club ID" screenshot, read once and attached from memory
+CLUB_ID_GUIDE_IMAGE = os.path.join(SCRIPT_DIR, "assets", "club_id_guide.png")
+try:
+    with open(CLUB_ID_GUIDE_IMAGE, 'rb') as f:
+        _CLUB_ID_GUIDE_BYTES = f.read()
+except OSError:
+    _CLUB_ID_GUIDE_BYTES = None
+
+@lru_cache(maxsize=1024)  # Pure str -> str; the same club URLs come back on every config load
+def extract_club_id_from_url(url: str) -> str:
+    """
     Extract Club ID (9-digit number) from club URL.
     
     Examples:
@@ -2963,253 +3763,231 @@ def extract_club_id_from_url(url: str) -> str:
     Returns:
         Club ID string or empty string if not found
     """
-    import re
-    # Find 9-digit number at the end of URL or after = sign
-    match = re.search(r'(\d{9})(?:\D*$|$)', url)
-    if match:
-        return match.group(1)
-    # Fallback: find any long number (6-12 digits)
-    match = re.search(r'(\d{6,12})(?:\D*$|$)', url)
-    if match:
-        return match.group(1)
-    return ""
-
-class CompetitiveClubSetupModal(discord.ui.Modal, title="Setup Competitive Club"):
-    """Modal for setting up a competitive club with quota"""
+    # Fast path: the two known URL shapes with the ID at the very end. Same result
+    # as the regexes below: the last 9 digits of the final digit run, or the
+    # whole run when it has 6-8 digits
+    for marker in ('circle_id=', '/club/'):
+        if marker in url:
+            club_id = url.rstrip('/').rpartition(marker)[2]
+            if club_id.isdecimal():
+                if len(club_id) >= 9:
+                    return club_id[-9:]
+                return club_id if len(club_id) >= 6 else ""
+            break
     
-    club_name_input = discord.ui.TextInput(
-        label="Club Name",
-        placeholder="My Club Name",
-        required=True,
-        max_length=50
-    )
+    # Find 9-digit number at the end of URL or after = sign,
+    # falling back to any long number (6-12 digits)
+    match = _CLUB_ID_RE_9.search(url) or _CLUB_ID_RE_FALLBACK.search(url)
+    return match.group(1) if match else ""
+
+
+def _validate_club_name(club_name: str) -> Optional[str]:
+    """Error message for a club name that can't be created, or None if it's valid"""
+    if not club_name:
+        return "❌ Error: Club name cannot be empty."
     
-    club_url_input = discord.ui.TextInput(
-        label="Club Profile URL",
-        placeholder="https://chronogenesis.net/club_profile?circle_id=XXXXXX",
-        required=True,
-        max_length=200
-    )
+    if len(club_name) > 50:
+        return "❌ Error: Club name is too long (max 50 characters)."
     
-    quota_input = discord.ui.TextInput(
-        label="Daily Quota (fans/day)",
-        placeholder="5000",
-        required=True,
-        min_length=1,
-        max_length=10
+    # Check for dangerous characters - deleting them changes the length only if any are present
+    if len(club_name.translate(_INVALID_CLUB_CHARS_TABLE)) != len(club_name):
+        found_invalid = _INVALID_CLUB_CHARS.intersection(club_name)
+        invalid_list = ', '.join(f"'{char}'" for char in _INVALID_CLUB_CHARS_DISPLAY if char in found_invalid)
+        return (
+            f"❌ Error: Club name contains invalid characters: {invalid_list}\n"
+            f"These characters cannot be used in Google Sheets tab names.\n"
+            f"Please avoid: / \\ ? * : [ ]"
+        )
+    
+    # Check if club already exists (case-insensitive) using existing cache
+    # Skip cache reload to speed up response - cache is updated after creation
+    club_name_lower = club_name.lower()
+    existing_club = client.config_cache_lower.get(club_name_lower)
+    if existing_club:
+        return (
+            f"❌ Error: Club '{existing_club}' already exists.\n"
+            f"(Club names are case-insensitive)"
+        )
+    
+    return None
+
+
+def _validate_club_url(club_url: str) -> Optional[str]:
+    """Error message for an unusable club URL, or None if it's valid"""
+    if not club_url:
+        return "❌ Error: Club URL cannot be empty."
+    
+    # Basic URL validation
+    if not club_url.startswith(_HTTP_PREFIXES):
+        return (
+            f"❌ Error: Club URL must start with http:// or https://\n"
+            f"Expected: https://chronogenesis.net/club_profile?circle_id=XXXXXX"
+        )
+    
+    return None
+
+
+_INVALID_URL_DESC_TEMPLATE = (
+    "Club URL must start with `http://` or `https://`\n\n"
+    "**Expected format:**\n"
+    "`https://chronogenesis.net/club_profile?circle_id=XXXXXX`\n\n"
+    "**Your URL:**\n"
+    "`{url}`\n\n"
+    "📌 **Club ID usually found here:**"
+)
+
+
+def _invalid_url_embed(club_url: str) -> discord.Embed:
+    """Invalid club URL embed pointing at the attached Club ID guide image"""
+    embed = discord.Embed(
+        title="❌ Invalid Club URL",
+        description=_INVALID_URL_DESC_TEMPLATE.format(url=club_url),
+        color=discord.Color.red()
     )
+    embed.set_image(url="attachment://club_id_guide.png")
+    return embed
+
+
+async def _send_club_url_error(interaction: discord.Interaction, club_url: str, error: str):
+    """Report an invalid club URL, with the Club ID guide image when one was entered"""
+    if club_url and _CLUB_ID_GUIDE_BYTES is not None:
+        # Show error with image guide
+        file = discord.File(BytesIO(_CLUB_ID_GUIDE_BYTES), filename="club_id_guide.png")
+        await interaction.followup.send(embed=_invalid_url_embed(club_url), file=file, ephemeral=True)
+        return
     
-    async def on_submit(self, interaction: discord.Interaction):
-        """Handle competitive club setup submission"""
-        await interaction.response.defer(ephemeral=True)
+    # Fallback if image not found
+    await interaction.followup.send(error, ephemeral=True)
+
+
+# Header rows written into every new club's sheets
+_DATA_SHEET_HEADER = ('Name', 'Day', 'Total Fans', 'Daily', 'Target', 'CarryOver')
+_MEMBERS_SHEET_HEADER = ('Trainer ID', 'Name')
+
+
+def _row_data(values) -> dict:
+    """batchUpdate RowData for raw values (numbers stay numbers, None stays empty, like RAW input)"""
+    return {"values": [
+        {} if value is None
+        else {"userEnteredValue": {"numberValue": value}} if isinstance(value, (int, float))
+        else {"userEnteredValue": {"stringValue": str(value)}}
+        for value in values
+    ]}
+
+
+def _add_sheet_with_header_requests(sheet_id: int, title: str, rows: int, cols: int, header: Tuple[str, ...]) -> List[dict]:
+    """batchUpdate requests that add a worksheet and write its header row"""
+    return [
+        {"addSheet": {"properties": {
+            "sheetId": sheet_id,
+            "title": title,
+            "gridProperties": {"rowCount": rows, "columnCount": cols}
+        }}},
+        {"updateCells": {
+            "start": {"sheetId": sheet_id, "rowIndex": 0, "columnIndex": 0},
+            "rows": [_row_data(header)],
+            "fields": "userEnteredValue"
+        }}
+    ]
+
+
+async def _create_club(
+    interaction: discord.Interaction,
+    club_name: str,
+    club_url: str,
+    target_quota: int,
+    club_type: str
+):
+    """Create a validated club's sheets and config row, then report back to the user"""
+    # Generate sheet names (club names are capped at 50 chars, well under the
+    # 100-char sheet name limit even with the suffix)
+    data_sheet = f"{club_name}_Data"
+    members_sheet = f"{club_name}_Members"
+    
+    try:
+        sh = gs_manager.sh
         
-        try:
-            # Extract values
-            club_name = self.club_name_input.value.strip()
-            club_url = self.club_url_input.value.strip()
-            quota_str = self.quota_input.value.strip()
-            
-            # ===== VALIDATE CLUB NAME =====
-            if not club_name:
-                await interaction.followup.send(
-                    "❌ Error: Club name cannot be empty.",
-                    ephemeral=True
-                )
-                return
-            
-            if len(club_name) > 50:
-                await interaction.followup.send(
-                    "❌ Error: Club name is too long (max 50 characters).",
-                    ephemeral=True
-                )
-                return
-            
-            # Check for dangerous characters
-            invalid_chars = ['/', '\\', '?', '*', ':', '[', ']']
-            found_invalid = [char for char in invalid_chars if char in club_name]
-            
-            if found_invalid:
-                invalid_list = ', '.join(f"'{char}'" for char in found_invalid)
-                await interaction.followup.send(
-                    f"❌ Error: Club name contains invalid characters: {invalid_list}\n"
-                    f"These characters cannot be used in Google Sheets tab names.\n"
-                    f"Please avoid: / \\ ? * : [ ]",
-                    ephemeral=True
-                )
-                return
-            
-            # Check if club already exists (case-insensitive) using existing cache
-            # Skip cache reload to speed up response - cache is updated after creation
-            for existing_club in client.config_cache.keys():
-                if existing_club.lower() == club_name.lower():
-                    await interaction.followup.send(
-                        f"❌ Error: Club '{existing_club}' already exists.\n"
-                        f"(Club names are case-insensitive)",
-                        ephemeral=True
-                    )
-                    return
-            
-            # ===== VALIDATE QUOTA =====
-            try:
-                target_quota = int(quota_str)
-                if target_quota <= 0:
-                    await interaction.followup.send(
-                        "❌ Error: Daily quota must be a positive number!",
-                        ephemeral=True
-                    )
-                    return
-            except ValueError:
-                await interaction.followup.send(
-                    "❌ Error: Daily quota must be a valid number!",
-                    ephemeral=True
-                )
-                return
-            
-            # ===== VALIDATE CLUB URL =====
-            if not club_url:
-                await interaction.followup.send(
-                    "❌ Error: Club URL cannot be empty.",
-                    ephemeral=True
-                )
-                return
-            
-            # Basic URL validation
-            if not club_url.startswith(('http://', 'https://')):
-                # Show error with image guide
-                embed = discord.Embed(
-                    title="❌ Invalid Club URL",
-                    description=(
-                        "Club URL must start with `http://` or `https://`\n\n"
-                        "**Expected format:**\n"
-                        "`https://chronogenesis.net/club_profile?circle_id=XXXXXX`\n\n"
-                        "**Your URL:**\n"
-                        f"`{club_url}`\n\n"
-                        "📌 **Club ID usually found here:**"
-                    ),
-                    color=discord.Color.red()
-                )
-                embed.set_image(url="attachment://club_id_guide.png")
-                
-                try:
-                    file = discord.File(os.path.join(SCRIPT_DIR, "assets", "club_id_guide.png"), filename="club_id_guide.png")
-                    await interaction.followup.send(embed=embed, file=file, ephemeral=True)
-                except FileNotFoundError:
-                    # Fallback if image not found
-                    await interaction.followup.send(
-                        f"❌ Error: Club URL must start with http:// or https://\n"
-                        f"Expected: https://chronogenesis.net/club_profile?circle_id=XXXXXX",
-                        ephemeral=True
-                    )
-                return
-            
-            # ===== CREATE CLUB =====
-            # Generate sheet names
-            data_sheet = f"{club_name}_Data"
-            members_sheet = f"{club_name}_Members"
-            
-            # Check sheet name length
-            if len(data_sheet) > 100 or len(members_sheet) > 100:
-                await interaction.followup.send(
-                    f"❌ Error: Club name is too long for sheet naming.\n"
-                    f"Sheet names would be:\n"
-                    f"- {data_sheet} ({len(data_sheet)} chars)\n"
-                    f"- {members_sheet} ({len(members_sheet)} chars)\n"
-                    f"Maximum: 100 characters per sheet name.",
-                    ephemeral=True
-                )
-                return
-            
-            # Create Data sheet (run in thread to avoid blocking)
-            data_ws = await asyncio.to_thread(
-                gs_manager.sh.add_worksheet, 
-                title=data_sheet, rows=100, cols=6
-            )
-            await asyncio.to_thread(
-                data_ws.update, 'A1:F1', 
-                [['Name', 'Day', 'Total Fans', 'Daily', 'Target', 'CarryOver']]
-            )
-            
-            print(f"✅ Created sheet: {data_sheet}")
-            
-            # Create Members sheet (run in thread to avoid blocking)
-            members_ws = await asyncio.to_thread(
-                gs_manager.sh.add_worksheet, 
-                title=members_sheet, rows=50, cols=2
-            )
-            await asyncio.to_thread(
-                members_ws.update, 'A1:B1', 
-                [['Trainer ID', 'Name']]
-            )
-            
-            print(f"✅ Created sheet: {members_sheet}")
-            
-            # Extract Club ID from URL
-            club_id = extract_club_id_from_url(club_url)
-            
-            # Get Server ID from interaction
-            server_id = str(interaction.guild_id) if interaction.guild_id else ""
-            
-            # Add to config with competitive type (run in thread)
-            config_ws = await asyncio.to_thread(
-                gs_manager.sh.worksheet, config.CONFIG_SHEET_NAME
-            )
-            await asyncio.to_thread(
-                config_ws.append_row,
-                [
-                    club_name,           # Column A: Club_Name
-                    data_sheet,          # Column B: Data_Sheet_Name
-                    members_sheet,       # Column C: Members_Sheet_Name
-                    target_quota,        # Column D: Target_Per_Day
-                    club_url,            # Column E: Club_URL
-                    "competitive",       # Column F: Club_Type
-                    club_id,             # Column G: Club_ID (auto-extracted)
-                    "",                  # Column H: Leaders
-                    "",                  # Column I: Officers
-                    server_id            # Column J: Server_ID (auto from guild)
-                ]
+        # Create both sheets with their headers in a single batchUpdate (run in thread).
+        # Sheet IDs are picked here so the header writes can target them in the same
+        # request; the batch is atomic, so a name clash leaves no half-created club.
+        data_sheet_id, members_sheet_id = random.sample(range(1, 2**31 - 1), 2)
+        await asyncio.to_thread(sh.batch_update, {"requests": [
+            *_add_sheet_with_header_requests(data_sheet_id, data_sheet, 100, 6, _DATA_SHEET_HEADER),
+            *_add_sheet_with_header_requests(members_sheet_id, members_sheet, 50, 2, _MEMBERS_SHEET_HEADER)
+        ]})
+        
+        logger.info("Created sheets: %s, %s", data_sheet, members_sheet)
+        
+        # Extract Club ID from URL
+        club_id = extract_club_id_from_url(club_url)
+        
+        # Get Server ID from interaction
+        server_id = str(interaction.guild_id) if interaction.guild_id else ""
+        
+        # Add to config (run in thread)
+        config_ws = gs_manager.config_ws or await asyncio.to_thread(gs_manager.get_config_worksheet)
+        await asyncio.to_thread(
+            config_ws.append_row,
+            [
+                club_name,           # Column A: Club_Name
+                data_sheet,          # Column B: Data_Sheet_Name
+                members_sheet,       # Column C: Members_Sheet_Name
+                target_quota,        # Column D: Target_Per_Day (0 for casual)
+                club_url,            # Column E: Club_URL
+                club_type,           # Column F: Club_Type
+                club_id,             # Column G: Club_ID (auto-extracted)
+                "",                  # Column H: Leaders
+                "",                  # Column I: Officers
+                server_id            # Column J: Server_ID (auto from guild)
+            ]
+        )
+        
+        logger.info("Added %s to config with URL: %s, ID: %s, Server: %s", club_name, club_url, club_id, server_id)
+        
+        # Update cache after creation
+        await client.update_caches()
+        
+        if club_type == "competitive":
+            type_line = f"🎯 **Daily Quota:** {format_fans(target_quota).replace('+', '')} fans/day\n"
+        else:
+            type_line = "😊 **Club Type:** Casual (no daily quota)\n"
+        
+        await interaction.followup.send(
+            f"✅ **Successfully created {club_type.title()} Club '{club_name}'!**\n\n"
+            f"📊 **Created sheets:**\n"
+            f"- Data: `{data_sheet}`\n"
+            f"- Members: `{members_sheet}`\n\n"
+            f"{type_line}"
+            f"🔗 **Club URL:** {club_url}\n\n"
+            f"**Next steps:**\n"
+            f"1. Use `/add_member` to add members\n"
+            f"2. Use `/club_set_webhook` to set notification channel",
+            ephemeral=True
+        )
+    
+    except Exception as e:
+        error_msg = str(e)
+        
+        # Handle duplicate sheet name error
+        if "already exists" in error_msg.lower():
+            await interaction.followup.send(
+                f"❌ Error: A sheet with this name already exists.\n"
+                f"Sheet names tried:\n"
+                f"- {data_sheet}\n"
+                f"- {members_sheet}\n\n"
+                f"Please choose a different club name.",
+                ephemeral=True
             )
-            
-            print(f"✅ Added {club_name} to config with URL: {club_url}, ID: {club_id}, Server: {server_id}")
-            
-            # Update cache after creation
-            await client.update_caches()
-            
+        else:
+            logger.exception("Error creating %s club %s", club_type, club_name)
             await interaction.followup.send(
-                f"✅ **Successfully created Competitive Club '{club_name}'!**\n\n"
-                f"📊 **Created sheets:**\n"
-                f"- Data: `{data_sheet}`\n"
-                f"- Members: `{members_sheet}`\n\n"
-                f"🎯 **Daily Quota:** {format_fans(target_quota).replace('+', '')} fans/day\n"
-                f"🔗 **Club URL:** {club_url}\n\n"
-                f"**Next steps:**\n"
-                f"1. Use `/add_member` to add members\n"
-                f"2. Use `/club_set_webhook` to set notification channel",
+                f"❌ An error occurred while creating the club:\n```{e}```",
                 ephemeral=True
             )
-        
-        except Exception as e:
-            error_msg = str(e)
-            
-            # Handle duplicate sheet name error
-            if "already exists" in error_msg.lower():
-                await interaction.followup.send(
-                    f"❌ Error: A sheet with this name already exists.\n"
-                    f"Sheet names tried:\n"
-                    f"- {data_sheet}\n"
-                    f"- {members_sheet}\n\n"
-                    f"Please choose a different club name.",
-                    ephemeral=True
-                )
-            else:
-                print(f"Error in CompetitiveClubSetupModal: {e}")
-                await interaction.followup.send(
-                    f"❌ An error occurred while creating the club:\n```{e}```",
-                    ephemeral=True
-                )
 
 
-class CasualClubSetupModal(discord.ui.Modal, title="Setup Casual Club"):
-    """Modal for setting up a casual club (no quota)"""
+class ClubSetupModal(discord.ui.Modal):
+    """Modal for setting up a club - competitive clubs also ask for a daily quota"""
     
     club_name_input = discord.ui.TextInput(
         label="Club Name",
@@ -3225,197 +4003,59 @@ class CasualClubSetupModal(discord.ui.Modal, title="Setup Casual Club"):
         max_length=200
     )
     
+    def __init__(self, competitive: bool):
+        super().__init__(title="Setup Competitive Club" if competitive else "Setup Casual Club")
+        self.competitive = competitive
+        self.quota_input = None
+        if competitive:
+            self.quota_input = discord.ui.TextInput(
+                label="Daily Quota (fans/day)",
+                placeholder="5000",
+                required=True,
+                min_length=1,
+                max_length=10
+            )
+            self.add_item(self.quota_input)
+    
     async def on_submit(self, interaction: discord.Interaction):
-        """Handle casual club setup submission"""
+        """Handle club setup submission"""
         await interaction.response.defer(ephemeral=True)
         
-        try:
-            # Extract values
-            club_name = self.club_name_input.value.strip()
-            club_url = self.club_url_input.value.strip()
-            target_quota = 0  # Casual clubs have no quota
-            
-            # ===== VALIDATE CLUB NAME =====
-            if not club_name:
-                await interaction.followup.send(
-                    "❌ Error: Club name cannot be empty.",
-                    ephemeral=True
-                )
-                return
-            
-            if len(club_name) > 50:
-                await interaction.followup.send(
-                    "❌ Error: Club name is too long (max 50 characters).",
-                    ephemeral=True
-                )
-                return
-            
-            # Check for dangerous characters
-            invalid_chars = ['/', '\\', '?', '*', ':', '[', ']']
-            found_invalid = [char for char in invalid_chars if char in club_name]
-            
-            if found_invalid:
-                invalid_list = ', '.join(f"'{char}'" for char in found_invalid)
-                await interaction.followup.send(
-                    f"❌ Error: Club name contains invalid characters: {invalid_list}\n"
-                    f"These characters cannot be used in Google Sheets tab names.\n"
-                    f"Please avoid: / \\ ? * : [ ]",
-                    ephemeral=True
-                )
-                return
-            
-            # Check if club already exists (case-insensitive) using existing cache
-            # Skip cache reload to speed up response - cache is updated after creation
-            for existing_club in client.config_cache.keys():
-                if existing_club.lower() == club_name.lower():
-                    await interaction.followup.send(
-                        f"❌ Error: Club '{existing_club}' already exists.\n"
-                        f"(Club names are case-insensitive)",
-                        ephemeral=True
-                    )
-                    return
-            
-            # ===== VALIDATE CLUB URL =====
-            if not club_url:
+        club_name = self.club_name_input.value.strip()
+        club_url = self.club_url_input.value.strip()
+        
+        error = _validate_club_name(club_name)
+        if error:
+            await interaction.followup.send(error, ephemeral=True)
+            return
+        
+        # ===== VALIDATE QUOTA =====
+        target_quota = 0  # Casual clubs have no quota
+        if self.competitive:
+            try:
+                target_quota = int(self.quota_input.value.strip())
+            except ValueError:
                 await interaction.followup.send(
-                    "❌ Error: Club URL cannot be empty.",
+                    "❌ Error: Daily quota must be a valid number!",
                     ephemeral=True
                 )
                 return
-            
-            # Basic URL validation
-            if not club_url.startswith(('http://', 'https://')):
-                # Show error with image guide
-                embed = discord.Embed(
-                    title="❌ Invalid Club URL",
-                    description=(
-                        "Club URL must start with `http://` or `https://`\n\n"
-                        "**Expected format:**\n"
-                        "`https://chronogenesis.net/club_profile?circle_id=XXXXXX`\n\n"
-                        "**Your URL:**\n"
-                        f"`{club_url}`\n\n"
-                        "📌 **Club ID usually found here:**"
-                    ),
-                    color=discord.Color.red()
-                )
-                embed.set_image(url="attachment://club_id_guide.png")
-                
-                try:
-                    file = discord.File(os.path.join(SCRIPT_DIR, "assets", "club_id_guide.png"), filename="club_id_guide.png")
-                    await interaction.followup.send(embed=embed, file=file, ephemeral=True)
-                except FileNotFoundError:
-                    # Fallback if image not found
-                    await interaction.followup.send(
-                        f"❌ Error: Club URL must start with http:// or https://\n"
-                        f"Expected: https://chronogenesis.net/club_profile?circle_id=XXXXXX",
-                        ephemeral=True
-                    )
-                return
-            
-            # ===== CREATE CLUB =====
-            # Generate sheet names
-            data_sheet = f"{club_name}_Data"
-            members_sheet = f"{club_name}_Members"
-            
-            # Check sheet name length
-            if len(data_sheet) > 100 or len(members_sheet) > 100:
+            if target_quota <= 0:
                 await interaction.followup.send(
-                    f"❌ Error: Club name is too long for sheet naming.\n"
-                    f"Sheet names would be:\n"
-                    f"- {data_sheet} ({len(data_sheet)} chars)\n"
-                    f"- {members_sheet} ({len(members_sheet)} chars)\n"
-                    f"Maximum: 100 characters per sheet name.",
+                    "❌ Error: Daily quota must be a positive number!",
                     ephemeral=True
                 )
                 return
-            
-            # Create Data sheet (run in thread to avoid blocking)
-            data_ws = await asyncio.to_thread(
-                gs_manager.sh.add_worksheet, 
-                title=data_sheet, rows=100, cols=6
-            )
-            await asyncio.to_thread(
-                data_ws.update, 'A1:F1', 
-                [['Name', 'Day', 'Total Fans', 'Daily', 'Target', 'CarryOver']]
-            )
-            
-            print(f"✅ Created sheet: {data_sheet}")
-            
-            # Create Members sheet (run in thread to avoid blocking)
-            members_ws = await asyncio.to_thread(
-                gs_manager.sh.add_worksheet, 
-                title=members_sheet, rows=50, cols=2
-            )
-            await asyncio.to_thread(
-                members_ws.update, 'A1:B1', 
-                [['Trainer ID', 'Name']]
-            )
-            
-            print(f"✅ Created sheet: {members_sheet}")
-            
-            # Extract Club ID from URL
-            club_id = extract_club_id_from_url(club_url)
-            
-            # Get Server ID from interaction
-            server_id = str(interaction.guild_id) if interaction.guild_id else ""
-            
-            # Add to config with casual type (run in thread)
-            config_ws = await asyncio.to_thread(
-                gs_manager.sh.worksheet, config.CONFIG_SHEET_NAME
-            )
-            await asyncio.to_thread(
-                config_ws.append_row,
-                [
-                    club_name,           # Column A: Club_Name
-                    data_sheet,          # Column B: Data_Sheet_Name
-                    members_sheet,       # Column C: Members_Sheet_Name
-                    target_quota,        # Column D: Target_Per_Day (0 for casual)
-                    club_url,            # Column E: Club_URL
-                    "casual",            # Column F: Club_Type
-                    club_id,             # Column G: Club_ID (auto-extracted)
-                    "",                  # Column H: Leaders
-                    "",                  # Column I: Officers
-                    server_id            # Column J: Server_ID (auto from guild)
-                ]
-            )
-            
-            print(f"✅ Added {club_name} to config with URL: {club_url}, ID: {club_id}, Server: {server_id}")
-            
-            # Update cache after creation
-            await client.update_caches()
-            
-            await interaction.followup.send(
-                f"✅ **Successfully created Casual Club '{club_name}'!**\n\n"
-                f"📊 **Created sheets:**\n"
-                f"- Data: `{data_sheet}`\n"
-                f"- Members: `{members_sheet}`\n\n"
-                f"😊 **Club Type:** Casual (no daily quota)\n"
-                f"🔗 **Club URL:** {club_url}\n\n"
-                f"**Next steps:**\n"
-                f"1. Use `/add_member` to add members\n"
-                f"2. Use `/club_set_webhook` to set notification channel",
-                ephemeral=True
-            )
         
-        except Exception as e:
-            error_msg = str(e)
-            
-            # Handle duplicate sheet name error
-            if "already exists" in error_msg.lower():
-                await interaction.followup.send(
-                    f"❌ Error: A sheet with this name already exists.\n"
-                    f"Sheet names tried:\n"
-                    f"- {data_sheet}\n"
-                    f"- {members_sheet}\n\n"
-                    f"Please choose a different club name.",
-                    ephemeral=True
-                )
-            else:
-                print(f"Error in CasualClubSetupModal: {e}")
-                await interaction.followup.send(
-                    f"❌ An error occurred while creating the club:\n```{e}```",
-                    ephemeral=True
-                )
+        error = _validate_club_url(club_url)
+        if error:
+            await _send_club_url_error(interaction, club_url, error)
+            return
+        
+        await _create_club(
+            interaction, club_name, club_url, target_quota,
+            "competitive" if self.competitive else "casual"
+        )
 
 
 # ============================================================================
@@ -3447,13 +4087,8 @@ async def club_setup(
 ):
     """Create a new club with data and member sheets - Shows modal based on club type"""
     
-    # Show the appropriate modal based on club type
-    if club_type == "competitive":
-        modal = CompetitiveClubSetupModal()
-    else:  # casual
-        modal = CasualClubSetupModal()
-    
-    await interaction.response.send_modal(modal)
+    # Show the modal for the club type (quota field only for competitive)
+    await interaction.response.send_modal(ClubSetupModal(competitive=(club_type == "competitive")))
 
 
 
@@ -3482,7 +4117,7 @@ async def club_set_url(
     # Validate URL
     club_url = club_url.strip()
     
-    if not club_url.startswith(('http://', 'https://')):
+    if not club_url.startswith(_HTTP_PREFIXES):
         await interaction.followup.send(
             "❌ Error: Club URL must start with http:// or https://",
             ephemeral=True
@@ -3508,11 +4143,12 @@ async def club_set_url(
         config_sheet = club_config['config_sheet']
         row_index = club_config['row']
         
-        # Update column E (Club_URL) - column 5
-        await asyncio.to_thread(config_sheet.update_cell, row_index, 5, club_url)
-        
-        # Update only this club's config cache (FAST - no full reload)
+        # Update only this club's config cache first (FAST - no full reload)
         await client.update_single_club_config(club_name, {'Club_URL': club_url})
+        
+        # Write column E (Club_URL) - column 5 - through to Google Sheets in the background
+        persist_cell_in_background(config_sheet, row_index, 5, club_url, club_name, 'Club_URL', interaction)
+        
         await interaction.followup.send(
             f"✅ Successfully updated club URL for '{club_name}'.\n"
             f"🔗 New URL: {club_url}",
@@ -3530,79 +4166,179 @@ async def club_set_url(
 # CLUB ROLE MANAGEMENT COMMANDS (Server Owner Only)
 # ============================================================================
 
-@client.tree.command(
-    name="club_assign_leader",
-    description="Admin/Owner: Assign a user as club Leader"
-)
-@app_commands.autocomplete(club_name=club_autocomplete)
-@app_commands.describe(
-    club_name="The club name",
-    user="User to assign as Leader"
-)
-@is_admin_or_has_role()
-async def club_assign_leader(
+class ClubCommandError(Exception):
+    """User-facing failure raised while resolving a club command's context"""
+    
+    def __init__(self, message: str, ephemeral: bool = False):
+        super().__init__(message)
+        self.ephemeral = ephemeral
+
+
+@dataclass(slots=True, frozen=True)
+class ClubCtx:
+    """Cached club state shared by the role/quota commands"""
+    name: str
+    config: dict
+    sheet: Optional[gspread.Worksheet]  # None in cached mode
+    row: Optional[int]
+    leaders: list
+    officers: list
+    is_admin: bool  # God Mode, Server Owner, or Leader of this club
+
+
+def resolve_club_context(
     interaction: discord.Interaction,
     club_name: str,
-    user: discord.Member
-):
-    """Assign a user as club Leader"""
-    await interaction.response.defer(ephemeral=False)
-    
-    # Check club exists
+    *,
+    require_sheet: bool = True,
+    leader_action: Optional[str] = None,
+    ephemeral: bool = False
+) -> ClubCtx:
+    """Look up a club in the cache and check the caller may act on it
+    
+    Raises ClubCommandError when the club is missing, the bot is in cached mode
+    (if require_sheet), or - when leader_action is given - the caller is neither
+    God Mode, the Server Owner, nor a Leader of the club.
+    """
     club_config = client.config_cache.get(club_name)
     if not club_config:
-        await interaction.followup.send(
-            f"❌ Club '{club_name}' not found!",
-            ephemeral=False
-        )
-        return
+        raise ClubCommandError(f"❌ Club '{club_name}' not found!", ephemeral)
     
-    if 'config_sheet' not in club_config:
-        await interaction.followup.send(
-            "❌ Bot is in cached mode. Cannot execute write command.",
-            ephemeral=False
+    if require_sheet and 'config_sheet' not in club_config:
+        raise ClubCommandError("❌ Bot is in cached mode. Cannot execute write command.", ephemeral)
+    
+    user_id = interaction.user.id
+    is_admin = (
+        user_id in GOD_MODE_USER_ID_SET
+        or bool(interaction.guild and interaction.guild.owner_id == user_id)
+        or club_name in client.leader_index.get(user_id, ())
+    )
+    if leader_action and not is_admin:
+        raise ClubCommandError(
+            f"❌ **Permission Denied**\n\n"
+            f"Only **Server Owners** or **Leaders** of `{club_name}` can {leader_action}.",
+            ephemeral=True
         )
-        return
     
+    return ClubCtx(
+        name=club_name,
+        config=club_config,
+        sheet=club_config.get('config_sheet'),
+        row=club_config.get('row'),
+        leaders=club_config.get('Leaders', []),
+        officers=club_config.get('Officers', []),
+        is_admin=is_admin
+    )
+
+
+# Upper bound for /club_set_quota - anything above is a typo, not a KPI
+MAX_DAILY_TARGET = 10_000_000
+
+# Shared success messages for the four role commands (role = "Leader"/"Officer")
+_ROLE_ASSIGNED_MSG = (
+    "✅ **Role Assigned**\n\n"
+    "User: {mention} (`{name}`)\n"
+    "Role: **{role}**\n"
+    "Club: `{club}`\n"
+    "Total {role}s: {total}"
+).format
+_ROLE_REMOVED_MSG = (
+    "✅ **Role Removed**\n\n"
+    "User: {mention}\n"
+    "Role: **{role}**\n"
+    "Club: `{club}`"
+).format
+
+
+def club_command(func):
+    """Send ClubCommandError messages as the command's followup (apply below @client.tree.command)"""
+    @functools.wraps(func)
+    async def wrapper(interaction: discord.Interaction, *args, **kwargs):
+        try:
+            return await func(interaction, *args, **kwargs)
+        except ClubCommandError as e:
+            await interaction.followup.send(str(e), ephemeral=e.ephemeral)
+    return wrapper
+
+
+# Per role list: (singular label, article, Clubs_Config column)
+_ROLE_LIST_INFO = {
+    'Leaders': ("Leader", "a", 8),
+    'Officers': ("Officer", "an", 10),
+}
+
+
+async def _mutate_role_list(
+    interaction: discord.Interaction,
+    ctx: ClubCtx,
+    role_field: str,
+    add: bool,
+    user: discord.Member
+):
+    """Add/remove a user in a club's Leaders or Officers and reply
+    
+    Shared by the four role commands: check membership, update the cached list
+    in place, persist the cell in the background, then send the followup.
+    """
+    role, article, column = _ROLE_LIST_INFO[role_field]
     try:
-        # Get current leaders
-        leaders = club_config.get('Leaders', [])
-        if isinstance(leaders, str):
-            # Parse JSON string
-            leaders = json.loads(leaders) if leaders else []
-        
-        # Check if already a leader
-        if user.id in leaders:
+        if (user.id in ctx.config[ROLE_SET_KEYS[role_field]]) == add:
+            state = "already" if add else "not"
             await interaction.followup.send(
-                f"⚠️ {user.mention} is already a Leader of `{club_name}`!",
+                f"⚠️ {user.mention} is {state} {article} {role} of `{ctx.name}`!",
                 ephemeral=False
             )
             return
         
-        # Add to leaders list
-        leaders.append(user.id)
-        
-        # Update in Google Sheets (column 8 - Leaders)
-        config_sheet = club_config['config_sheet']
-        row = club_config['row']
-        await asyncio.to_thread(config_sheet.update_cell, row, 8, json.dumps(leaders))
+        # Update the cached list in place
+        user_ids = ctx.leaders if role_field == 'Leaders' else ctx.officers
+        if add:
+            user_ids.append(user.id)
+        else:
+            user_ids[:] = [uid for uid in user_ids if uid != user.id]
         
-        # Update only this club's config cache (FAST - no full reload)
-        await client.update_single_club_config(club_name, {'Leaders': json.dumps(leaders)})
+        # Update only this club's config cache first (FAST - no full reload)
+        await client.update_single_club_config(ctx.name, {role_field: user_ids})
         
-        await interaction.followup.send(
-            f"✅ **Role Assigned**\n\n"
-            f"User: {user.mention} (`{user.name}`)\n"
-            f"Role: **Leader**\n"
-            f"Club: `{club_name}`\n"
-            f"Total Leaders: {len(leaders)}",
-            ephemeral=False
+        # Write through to Google Sheets in the background
+        persist_cell_in_background(
+            ctx.sheet, ctx.row, column, dumps_role_list(user_ids), ctx.name, role_field, interaction
         )
+        
+        if add:
+            message = _ROLE_ASSIGNED_MSG(
+                mention=user.mention, name=user.name, role=role, club=ctx.name, total=len(user_ids)
+            )
+        else:
+            message = _ROLE_REMOVED_MSG(mention=user.mention, role=role, club=ctx.name)
+        await interaction.followup.send(message, ephemeral=False)
     
     except Exception as e:
         await interaction.followup.send(f"❌ Error: {e}", ephemeral=False)
 
 
+@client.tree.command(
+    name="club_assign_leader",
+    description="Admin/Owner: Assign a user as club Leader"
+)
+@app_commands.autocomplete(club_name=club_autocomplete)
+@app_commands.describe(
+    club_name="The club name",
+    user="User to assign as Leader"
+)
+@is_admin_or_has_role()
+@club_command
+async def club_assign_leader(
+    interaction: discord.Interaction,
+    club_name: str,
+    user: discord.Member
+):
+    """Assign a user as club Leader"""
+    await interaction.response.defer(ephemeral=False)
+    ctx = resolve_club_context(interaction, club_name)
+    await _mutate_role_list(interaction, ctx, 'Leaders', add=True, user=user)
+
+
 @client.tree.command(
     name="club_assign_officer",
     description="Leader/Server Owner: Assign a user as club Officer"
@@ -3612,6 +4348,7 @@ async def club_assign_leader(
     club_name="The club name",
     user="User to assign as Officer"
 )
+@club_command
 async def club_assign_officer(
     interaction: discord.Interaction,
     club_name: str,
@@ -3619,74 +4356,8 @@ async def club_assign_officer(
 ):
     """Assign a user as club Officer (Leaders can do this)"""
     await interaction.response.defer(ephemeral=False)
-    
-    club_config = client.config_cache.get(club_name)
-    if not club_config:
-        await interaction.followup.send(
-            f"❌ Club '{club_name}' not found!",
-            ephemeral=False
-        )
-        return
-    
-    if 'config_sheet' not in club_config:
-        await interaction.followup.send(
-            "❌ Bot is in cached mode. Cannot execute write command.",
-            ephemeral=False
-        )
-        return
-    
-    # Check permissions: God Mode, Server Owner, or Leader of this club
-    is_god_mode = interaction.user.id in config.GOD_MODE_USER_IDS
-    is_server_owner = interaction.guild and interaction.guild.owner_id == interaction.user.id
-    
-    # Check if user is a Leader of this club
-    leaders = club_config.get('Leaders', [])
-    if isinstance(leaders, str):
-        leaders = json.loads(leaders) if leaders else []
-    is_leader = interaction.user.id in leaders
-    
-    if not (is_god_mode or is_server_owner or is_leader):
-        await interaction.followup.send(
-            f"❌ **Permission Denied**\n\n"
-            f"Only **Server Owners** or **Leaders** of `{club_name}` can assign Officers.",
-            ephemeral=True
-        )
-        return
-    
-    try:
-        # Get current officers
-        officers = club_config.get('Officers', [])
-        if isinstance(officers, str):
-            officers = json.loads(officers) if officers else []
-        
-        if user.id in officers:
-            await interaction.followup.send(
-                f"⚠️ {user.mention} is already an Officer of `{club_name}`!",
-                ephemeral=False
-            )
-            return
-        
-        officers.append(user.id)
-        
-        # Update in Google Sheets (column 10 - Officers)
-        config_sheet = club_config['config_sheet']
-        row = club_config['row']
-        await asyncio.to_thread(config_sheet.update_cell, row, 10, json.dumps(officers))
-        
-        # Update only this club's config cache (FAST - no full reload)
-        await client.update_single_club_config(club_name, {'Officers': json.dumps(officers)})
-        
-        await interaction.followup.send(
-            f"✅ **Role Assigned**\n\n"
-            f"User: {user.mention} (`{user.name}`)\n"
-            f"Role: **Officer**\n"
-            f"Club: `{club_name}`\n"
-            f"Total Officers: {len(officers)}",
-            ephemeral=False
-        )
-    
-    except Exception as e:
-        await interaction.followup.send(f"❌ Error: {e}", ephemeral=False)
+    ctx = resolve_club_context(interaction, club_name, leader_action="assign Officers")
+    await _mutate_role_list(interaction, ctx, 'Officers', add=True, user=user)
 
 
 @client.tree.command(
@@ -3699,6 +4370,7 @@ async def club_assign_officer(
     user="User to remove from Leaders"
 )
 @is_admin_or_has_role()
+@club_command
 async def club_remove_leader(
     interaction: discord.Interaction,
     club_name: str,
@@ -3706,53 +4378,8 @@ async def club_remove_leader(
 ):
     """Remove Leader role from user"""
     await interaction.response.defer(ephemeral=False)
-    
-    club_config = client.config_cache.get(club_name)
-    if not club_config:
-        await interaction.followup.send(
-            f"❌ Club '{club_name}' not found!",
-            ephemeral=False
-        )
-        return
-    
-    if 'config_sheet' not in club_config:
-        await interaction.followup.send(
-            "❌ Bot is in cached mode. Cannot execute write command.",
-            ephemeral=False
-        )
-        return
-    
-    try:
-        leaders = club_config.get('Leaders', [])
-        if isinstance(leaders, str):
-            leaders = json.loads(leaders) if leaders else []
-        
-        if user.id not in leaders:
-            await interaction.followup.send(
-                f"⚠️ {user.mention} is not a Leader of `{club_name}`!",
-                ephemeral=False
-            )
-            return
-        
-        leaders.remove(user.id)
-        
-        config_sheet = club_config['config_sheet']
-        row = club_config['row']
-        await asyncio.to_thread(config_sheet.update_cell, row, 8, json.dumps(leaders))  # Column 8 = Leaders
-        
-        # Update only this club's config cache (FAST - no full reload)
-        await client.update_single_club_config(club_name, {'Leaders': json.dumps(leaders)})
-        
-        await interaction.followup.send(
-            f"✅ **Role Removed**\n\n"
-            f"User: {user.mention}\n"
-            f"Role: **Leader**\n"
-            f"Club: `{club_name}`",
-            ephemeral=False
-        )
-    
-    except Exception as e:
-        await interaction.followup.send(f"❌ Error: {e}", ephemeral=False)
+    ctx = resolve_club_context(interaction, club_name)
+    await _mutate_role_list(interaction, ctx, 'Leaders', add=False, user=user)
 
 
 @client.tree.command(
@@ -3765,6 +4392,7 @@ async def club_remove_leader(
     user="User to remove from Officers"
 )
 @is_primary_admin()
+@club_command
 async def club_remove_officer(
     interaction: discord.Interaction,
     club_name: str,
@@ -3772,53 +4400,63 @@ async def club_remove_officer(
 ):
     """Remove Officer role from user"""
     await interaction.response.defer(ephemeral=False)
+    ctx = resolve_club_context(interaction, club_name)
+    await _mutate_role_list(interaction, ctx, 'Officers', add=False, user=user)
+
+
+def _format_role_holder(user_id: int, user) -> str:
+    """One /club_show_roles line; unresolved users fall back to their ID"""
+    return f"• {user.mention} (`{user.name}`)" if user else f"• User ID: {user_id}"
+
+
+# Discord caps an embed field value at 1024 chars, and a whole embed at 25
+# fields / 6000 chars (title, field names/values, footer and author combined)
+EMBED_FIELD_VALUE_LIMIT = 1024
+EMBED_MAX_FIELDS = 25
+EMBED_TOTAL_LIMIT = 6000
+_ROLE_OVERFLOW_TMPL = "… and {count} more"
+
+
+def _add_role_list_fields(
+    embed: discord.Embed,
+    title: str,
+    lines: List[str],
+    reserve_fields: int = 0,
+    reserve_chars: int = 0
+):
+    """Add a role list as one field, continued in extra fields if it is too long
     
-    club_config = client.config_cache.get(club_name)
-    if not club_config:
-        await interaction.followup.send(
-            f"❌ Club '{club_name}' not found!",
-            ephemeral=False
-        )
-        return
-    
-    if 'config_sheet' not in club_config:
-        await interaction.followup.send(
-            "❌ Bot is in cached mode. Cannot execute write command.",
-            ephemeral=False
-        )
-        return
-    
-    try:
-        officers = club_config.get('Officers', [])
-        if isinstance(officers, str):
-            officers = json.loads(officers) if officers else []
-        
-        if user.id not in officers:
-            await interaction.followup.send(
-                f"⚠️ {user.mention} is not an Officer of `{club_name}`!",
-                ephemeral=False
-            )
-            return
-        
-        officers.remove(user.id)
-        
-        config_sheet = club_config['config_sheet']
-        row = club_config['row']
-        await asyncio.to_thread(config_sheet.update_cell, row, 10, json.dumps(officers))
-        
-        # Update only this club's config cache (FAST - no full reload)
-        await client.update_single_club_config(club_name, {'Officers': json.dumps(officers)})
-        
-        await interaction.followup.send(
-            f"✅ **Role Removed**\n\n"
-            f"User: {user.mention}\n"
-            f"Role: **Officer**\n"
-            f"Club: `{club_name}`",
-            ephemeral=False
-        )
-    
-    except Exception as e:
-        await interaction.followup.send(f"❌ Error: {e}", ephemeral=False)
+    Chunks in a single pass with a running length (+1 per newline separator).
+    Stops before the embed's field/total-length limits, less what the caller
+    reserves for later fields, and ends with an "… and N more" line.
+    """
+    overflow_len = 1 + len(_ROLE_OVERFLOW_TMPL.format(count=len(lines)))
+    value_limit = EMBED_FIELD_VALUE_LIMIT - overflow_len  # Room to append the overflow line
+    name = f"{title} ({len(lines)})"
+    cont_name = f"{title} (cont.)"
+    fields_left = EMBED_MAX_FIELDS - len(embed.fields) - reserve_fields
+    chars_left = EMBED_TOTAL_LIMIT - len(embed) - reserve_chars - overflow_len - len(name)
+    chunk, chunk_len = [], -1  # -1: the first line has no separator
+    shown = 0
+    for line in lines:
+        cost = 1 + len(line)
+        if chunk and chunk_len + cost > value_limit:
+            if fields_left <= 1 or cost + len(cont_name) > chars_left:
+                break
+            embed.add_field(name=name, value="\n".join(chunk), inline=False)
+            fields_left -= 1
+            chars_left -= len(cont_name)
+            name = cont_name
+            chunk, chunk_len = [], -1
+        elif cost > chars_left:
+            break
+        chunk.append(line)
+        chunk_len += cost
+        chars_left -= cost
+        shown += 1
+    if shown < len(lines):
+        chunk.append(_ROLE_OVERFLOW_TMPL.format(count=len(lines) - shown))
+    embed.add_field(name=name, value="\n".join(chunk), inline=False)
 
 
 @client.tree.command(
@@ -3827,44 +4465,58 @@ async def club_remove_officer(
 )
 @app_commands.autocomplete(club_name=club_autocomplete)
 @app_commands.describe(club_name="The club name")
+@club_command
 async def club_show_roles(
     interaction: discord.Interaction,
     club_name: str
 ):
     """Show all role assignments for a club"""
     await interaction.response.defer(ephemeral=True)
-    
-    club_config = client.config_cache.get(club_name)
-    if not club_config:
-        await interaction.followup.send(
-            f"❌ Club '{club_name}' not found!",
-            ephemeral=True
-        )
-        return
+    ctx = resolve_club_context(interaction, club_name, require_sheet=False, ephemeral=True)
     
     embed = discord.Embed(
         title=f"🎖️ Club Roles: {club_name}",
         color=discord.Color.blue()
     )
     
-    # Leaders
-    leaders = club_config.get('Leaders', [])
-    if isinstance(leaders, str):
-        leaders = json.loads(leaders) if leaders else []
+    leaders = ctx.leaders
+    officers = ctx.officers
     
+    # Resolve every role holder once: guild/user caches first, then fetch the
+    # rest concurrently instead of one HTTP round-trip per user
+    guild = interaction.guild  # Guild members first - no I/O for anyone in this server
+    users = {
+        uid: (guild and guild.get_member(uid)) or client.get_user(uid)
+        for uid in {*leaders, *officers}
+    }
+    missing = [uid for uid, u in users.items() if u is None]
+    if missing:
+        fetched = await asyncio.gather(
+            *(client.fetch_user(uid) for uid in missing),
+            return_exceptions=True
+        )
+        for uid, result in zip(missing, fetched):
+            if not isinstance(result, BaseException):
+                users[uid] = result
+    
+    # One line per holder, built in a single pass each
+    leader_lines = [_format_role_holder(uid, users[uid]) for uid in leaders]
+    officer_lines = [_format_role_holder(uid, users[uid]) for uid in officers]
+    
+    # Footer first so it counts against the embed's total length below
+    embed.set_footer(text=SUPPORT_MESSAGE)
+    
+    # Leaders - leave the Officers list a field and up to half the remaining room
     if leaders:
-        leader_list = []
-        for lid in leaders:
-            try:
-                leader = await client.fetch_user(lid)
-                leader_list.append(f"• {leader.mention} (`{leader.name}`)")
-            except:
-                leader_list.append(f"• User ID: {lid}")
-        
-        embed.add_field(
-            name=f"⭐ Leaders ({len(leaders)})",
-            value="\n".join(leader_list),
-            inline=False
+        officers_len = (
+            len("🛡️ Officers (cont.)")
+            + len(_ROLE_OVERFLOW_TMPL.format(count=len(officer_lines))) + 1
+            + max(sum(1 + len(line) for line in officer_lines), len("No officers assigned"))
+        )
+        _add_role_list_fields(
+            embed, "⭐ Leaders", leader_lines,
+            reserve_fields=1,
+            reserve_chars=min(officers_len, (EMBED_TOTAL_LIMIT - len(embed)) // 2)
         )
     else:
         embed.add_field(
@@ -3874,24 +4526,8 @@ async def club_show_roles(
         )
     
     # Officers  
-    officers = club_config.get('Officers', [])
-    if isinstance(officers, str):
-        officers = json.loads(officers) if officers else []
-    
     if officers:
-        officer_list = []
-        for oid in officers:
-            try:
-                officer = await client.fetch_user(oid)
-                officer_list.append(f"• {officer.mention} (`{officer.name}`)")
-            except:
-                officer_list.append(f"• User ID: {oid}")
-        
-        embed.add_field(
-            name=f"🛡️ Officers ({len(officers)})",
-            value="\n".join(officer_list),
-            inline=False
-        )
+        _add_role_list_fields(embed, "🛡️ Officers", officer_lines)
     else:
         embed.add_field(
             name="🛡️ Officers",
@@ -3899,8 +4535,6 @@ async def club_show_roles(
             inline=False
         )
     
-    embed.set_footer(text=SUPPORT_MESSAGE)
-    
     await interaction.followup.send(embed=embed, ephemeral=True)
 
 
@@ -3913,307 +4547,295 @@ async def club_show_roles(
     club_name="The club name",
     daily_target="New daily target/KPI for club members"
 )
+@club_command
 async def club_set_quota(
     interaction: discord.Interaction,
     club_name: str,
     daily_target: int
 ):
     """Update club daily target/quota (Leaders can do this)"""
+    # Validate daily target before deferring - bad input is answered in one response
+    if daily_target < 0:
+        await interaction.response.send_message(
+            "❌ Daily target must be a positive number!",
+            ephemeral=True
+        )
+        return
+    if daily_target > MAX_DAILY_TARGET:
+        await interaction.response.send_message(
+            f"❌ Daily target cannot exceed {MAX_DAILY_TARGET:,}!",
+            ephemeral=True
+        )
+        return
+    
     await interaction.response.defer(ephemeral=False)
+    ctx = resolve_club_context(interaction, club_name, leader_action="update quota")
+    
+    try:
+        # Get current quota
+        old_quota = ctx.config.get('Target_Per_Day', 0)
+        
+        # Update only this club's config cache first (FAST - no full reload)
+        await client.update_single_club_config(club_name, {'Target_Per_Day': daily_target})
+        
+        # Write through to Google Sheets in the background (column 4 - Target_Per_Day)
+        persist_cell_in_background(ctx.sheet, ctx.row, 4, daily_target, club_name, 'Target_Per_Day', interaction)
+        
+        await interaction.followup.send(
+            f"✅ **Quota Updated**\n\n"
+            f"Club: `{club_name}`\n"
+            f"Old Target: **{old_quota:,}** fans/day\n"
+            f"New Target: **{daily_target:,}** fans/day\n"
+            f"Updated by: {interaction.user.mention}",
+            ephemeral=False
+        )
+    
+    except Exception as e:
+        await interaction.followup.send(f"❌ Error: {e}", ephemeral=False)
+
+
+# ============================================================================
+# HELP COMMAND WITH INTERACTIVE BUTTONS
+# ============================================================================
+
+def _build_user_help_embed() -> discord.Embed:
+    """Build the static User Commands help page"""
+    embed = discord.Embed(
+        title="👤 User Commands",
+        description="Commands available to all users",
+        color=discord.Color.blue()
+    )
+    
+    # Stats Commands
+    embed.add_field(
+        name="━━━━━━ 📊 Stats & Rankings ━━━━━━",
+        value="‎",  # Zero-width space
+        inline=False
+    )
+    
+    embed.add_field(
+        name="📊 /leaderboard",
+        value=(
+            "View club member rankings and fan counts\n"
+            "`/leaderboard club_name:[select]`\n\n"
+            "Shows rankings, daily gains, targets, and surplus/deficit"
+        ),
+        inline=False
+    )
+    
+    embed.add_field(
+        name="📈 /stats",
+        value=(
+            "View detailed stats for a specific member\n"
+            "`/stats club_name:[select] member_name:[select]`\n\n"
+            "Shows fan count, daily growth, rank, and performance"
+        ),
+        inline=False
+    )
+    
+    embed.add_field(
+        name="👤 /profile",
+        value=(
+            "View stats for your linked profile\n"
+            "`/profile`\n\n"
+            "Quick access after linking via `/stats` ➜ 'Yes, this is me'"
+        ),
+        inline=False
+    )
+    
+    # Discovery Commands
+    embed.add_field(
+        name="━━━━━━ 🔍 Discovery ━━━━━━",
+        value="‎",
+        inline=False
+    )
+    
+    embed.add_field(
+        name="🔍 /search_club",
+        value=(
+            "Search and request tracking for new clubs\n"
+            "`/search_club club_name:[type exact name]`\n\n"
+            "⚠️ Cooldown: 30 seconds per user"
+        ),
+        inline=False
+    )
+    
+    embed.add_field(
+        name="📋 /club_list",
+        value=(
+            "Browse all clubs in this server\n"
+            "`/club_list`\n\n"
+            "Shows all clubs, types, member counts, and quotas"
+        ),
+        inline=False
+    )
+    
+    embed.add_field(
+        name="👥 /club_show_roles",
+        value=(
+            "View Leaders and Officers of a club\n"
+            "`/club_show_roles club_name:[select]`"
+        ),
+        inline=False
+    )
+    
+    # Info Commands
+    embed.add_field(
+        name="━━━━━━ ℹ️ System Info ━━━━━━",
+        value="‎",
+        inline=False
+    )
+    
+    embed.add_field(
+        name="ℹ️ /status & /uptime",
+        value=(
+            "`/status` - Check bot health and latency\n"
+            "`/uptime` - See how long bot has been online"
+        ),
+        inline=False
+    )
+    
+    # Add support server link
+    embed.add_field(
+        name="━━━━━━ 💬 Support ━━━━━━",
+        value=(
+            f"❓ {SUPPORT_HELP_MESSAGE}: [Join Here]({SUPPORT_SERVER_URL})\n"
+            f"☕ Donation: [{DONATION_MESSAGE}]({DONATION_URL})"
+        ),
+        inline=False
+    )
+    
+    embed.set_footer(text="💡 Tip: Use autocomplete by typing commands")
+    
+    return embed
+
+
+def _build_manager_help_embed() -> discord.Embed:
+    """Build the static Manager Commands help page"""
+    embed = discord.Embed(
+        title="🛡️ Manager Commands",
+        description=(
+            "**Permissions:**\n"
+            "👑 Admin - Full access | ⭐ Leader - Club management | 🛡️ Officer - Display role"
+        ),
+        color=discord.Color.green()
+    )
+    
+    # Admin Commands
+    embed.add_field(
+        name="━━━━━━ 👑 Admin Commands ━━━━━━",
+        value="‎",
+        inline=False
+    )
+    
+    embed.add_field(
+        name="Club Management",
+        value=(
+            "`/club_setup` - Create new club\n"
+            "• Setup club name, type (casual/competitive), and daily quota\n\n"
+    
+            "`/club_assign_leader` - Assign Leader role\n"
+            "`/club_remove_leader` - Remove Leader role\n"
+            "• Only Server Owner/Admin can manage Leaders"
+        ),
+        inline=False
+    )
+    
+    embed.add_field(
+        name="Role Management",
+        value=(
+            "`/club_assign_officer` - Assign Officer role\n"
+            "`/club_remove_officer` - Remove Officer role"
+        ),
+        inline=False
+    )
+    
+    embed.add_field(
+        name="Channel Management",
+        value=(
+            "`/set_channel` - Set current channel as allowed\n"
+            "• Run this command in the channel you want to use\n"
+            "• Automatically replaces previous channel"
+        ),
+        inline=False
+    )
+    
+    # Leader Commands
+    embed.add_field(
+        name="━━━━━━ ⭐ Leader Commands ━━━━━━",
+        value="‎",
+        inline=False
+    )
+    
+    embed.add_field(
+        name="Club Configuration",
+        value=(
+            "`/club_setup` - Leaders can also create clubs\n\n"
     
-    club_config = client.config_cache.get(club_name)
-    if not club_config:
-        await interaction.followup.send(
-            f"❌ Club '{club_name}' not found!",
-            ephemeral=False
-        )
-        return
+            "`/club_set_quota` - Update daily target\n"
+            "• Set daily fan quota for competitive clubs\n\n"
     
-    if 'config_sheet' not in club_config:
-        await interaction.followup.send(
-            "❌ Bot is in cached mode. Cannot execute write command.",
-            ephemeral=False
-        )
-        return
+            "`/club_set_url` - Update club URL\n"
+            "• Paste club profile URL from uma.moe\n\n"
     
-    # Check permissions: God Mode, Server Owner, or Leader of this club
-    is_god_mode = interaction.user.id in config.GOD_MODE_USER_IDS
-    is_server_owner = interaction.guild and interaction.guild.owner_id == interaction.user.id
+            "`/club_set_type` - Change club type\n"
+            "• Switch between casual and competitive"
+        ),
+        inline=False
+    )
     
-    # Check if user is a Leader of this club
-    leaders = club_config.get('Leaders', [])
-    if isinstance(leaders, str):
-        leaders = json.loads(leaders) if leaders else []
-    is_leader = interaction.user.id in leaders
+    # Officer Note
+    embed.add_field(
+        name="━━━━━━ 🛡️ Officer Role ━━━━━━",
+        value="‎",
+        inline=False
+    )
     
-    if not (is_god_mode or is_server_owner or is_leader):
-        await interaction.followup.send(
-            f"❌ **Permission Denied**\n\n"
-            f"Only **Server Owners** or **Leaders** of `{club_name}` can update quota.",
-            ephemeral=True
-        )
-        return
+    embed.add_field(
+        name="ℹ️ Note",
+        value=(
+            "Officers have same permissions as regular members\n"
+            "This is an organizational role for club hierarchy display\n\n"
+            "**Members are auto-synced daily** - no manual commands needed"
+        ),
+        inline=False
+    )
     
-    # Validate daily target
-    if daily_target < 0:
-        await interaction.followup.send(
-            "❌ Daily target must be a positive number!",
-            ephemeral=False
-        )
-        return
+    # Add support server link
+    embed.add_field(
+        name="━━━━━━ 💬 Support ━━━━━━",
+        value=(
+            f"❓ {SUPPORT_HELP_MESSAGE}: [Join Here]({SUPPORT_SERVER_URL})\n"
+            f"☕ Donation: [{DONATION_MESSAGE}]({DONATION_URL})"
+        ),
+        inline=False
+    )
     
-    try:
-        # Get current quota
-        old_quota = club_config.get('Target_Per_Day', 0)
-        
-        # Update in Google Sheets (column 4 - Target_Per_Day)
-        config_sheet = club_config['config_sheet']
-        row = club_config['row']
-        await asyncio.to_thread(config_sheet.update_cell, row, 4, daily_target)
-        
-        # Update only this club's config cache (FAST - no full reload)
-        await client.update_single_club_config(club_name, {'Target_Per_Day': daily_target})
-        
-        await interaction.followup.send(
-            f"✅ **Quota Updated**\n\n"
-            f"Club: `{club_name}`\n"
-            f"Old Target: **{old_quota:,}** fans/day\n"
-            f"New Target: **{daily_target:,}** fans/day\n"
-            f"Updated by: {interaction.user.mention}",
-            ephemeral=False
-        )
+    embed.set_footer(text="💡 Use autocomplete when typing commands")
     
-    except Exception as e:
-        await interaction.followup.send(f"❌ Error: {e}", ephemeral=False)
+    return embed
 
 
-# ============================================================================
-# HELP COMMAND WITH INTERACTIVE BUTTONS
-# ============================================================================
+# The help pages have no per-user content, so they are built once at import
+_USER_HELP_EMBED = _build_user_help_embed()
+_MANAGER_HELP_EMBED = _build_manager_help_embed()
+
 
 class HelpView(discord.ui.View):
     """Interactive help menu with buttons for different command categories"""
     
     def __init__(self):
-        super().__init__(timeout=180)  # 3 minutes timeout
+        super().__init__(timeout=None)  # Persistent - registered once via client.add_view
     
     @discord.ui.button(label="👤 User Commands", style=discord.ButtonStyle.primary, custom_id="user_help")
     async def user_commands_button(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Show user commands with detailed explanations"""
-        embed = discord.Embed(
-            title="👤 User Commands",
-            description="Commands available to all users",
-            color=discord.Color.blue()
-        )
-        
-        # Stats Commands
-        embed.add_field(
-            name="━━━━━━ 📊 Stats & Rankings ━━━━━━",
-            value="‎",  # Zero-width space
-            inline=False
-        )
-        
-        embed.add_field(
-            name="📊 /leaderboard",
-            value=(
-                "View club member rankings and fan counts\n"
-                "`/leaderboard club_name:[select]`\n\n"
-                "Shows rankings, daily gains, targets, and surplus/deficit"
-            ),
-            inline=False
-        )
-        
-        embed.add_field(
-            name="📈 /stats",
-            value=(
-                "View detailed stats for a specific member\n"
-                "`/stats club_name:[select] member_name:[select]`\n\n"
-                "Shows fan count, daily growth, rank, and performance"
-            ),
-            inline=False
-        )
-        
-        embed.add_field(
-            name="👤 /profile",
-            value=(
-                "View stats for your linked profile\n"
-                "`/profile`\n\n"
-                "Quick access after linking via `/stats` ➜ 'Yes, this is me'"
-            ),
-            inline=False
-        )
-        
-        # Discovery Commands
-        embed.add_field(
-            name="━━━━━━ 🔍 Discovery ━━━━━━",
-            value="‎",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="🔍 /search_club",
-            value=(
-                "Search and request tracking for new clubs\n"
-                "`/search_club club_name:[type exact name]`\n\n"
-                "⚠️ Cooldown: 30 seconds per user"
-            ),
-            inline=False
-        )
-        
-        embed.add_field(
-            name="📋 /club_list",
-            value=(
-                "Browse all clubs in this server\n"
-                "`/club_list`\n\n"
-                "Shows all clubs, types, member counts, and quotas"
-            ),
-            inline=False
-        )
-        
-        embed.add_field(
-            name="👥 /club_show_roles",
-            value=(
-                "View Leaders and Officers of a club\n"
-                "`/club_show_roles club_name:[select]`"
-            ),
-            inline=False
-        )
-        
-        # Info Commands
-        embed.add_field(
-            name="━━━━━━ ℹ️ System Info ━━━━━━",
-            value="‎",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="ℹ️ /status & /uptime",
-            value=(
-                "`/status` - Check bot health and latency\n"
-                "`/uptime` - See how long bot has been online"
-            ),
-            inline=False
-        )
-        
-        # Add support server link
-        embed.add_field(
-            name="━━━━━━ 💬 Support ━━━━━━",
-            value=(
-                f"❓ {SUPPORT_HELP_MESSAGE}: [Join Here]({SUPPORT_SERVER_URL})\n"
-                f"☕ Donation: [{DONATION_MESSAGE}]({DONATION_URL})"
-            ),
-            inline=False
-        )
-        
-        embed.set_footer(text="💡 Tip: Use autocomplete by typing commands")
-        
-        await interaction.response.edit_message(embed=embed, view=self)
+        await interaction.response.edit_message(embed=_USER_HELP_EMBED, view=self)
     
     @discord.ui.button(label="🛡️ Manager Commands", style=discord.ButtonStyle.success, custom_id="manager_help")
     async def manager_commands_button(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Show manager/admin commands"""
-        embed = discord.Embed(
-            title="🛡️ Manager Commands",
-            description=(
-                "**Permissions:**\n"
-                "👑 Admin - Full access | ⭐ Leader - Club management | 🛡️ Officer - Display role"
-            ),
-            color=discord.Color.green()
-        )
-        
-        # Admin Commands
-        embed.add_field(
-            name="━━━━━━ 👑 Admin Commands ━━━━━━",
-            value="‎",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="Club Management",
-            value=(
-                "`/club_setup` - Create new club\n"
-                "• Setup club name, type (casual/competitive), and daily quota\n\n"
-                
-                "`/club_assign_leader` - Assign Leader role\n"
-                "`/club_remove_leader` - Remove Leader role\n"
-                "• Only Server Owner/Admin can manage Leaders"
-            ),
-            inline=False
-        )
-        
-        embed.add_field(
-            name="Role Management",
-            value=(
-                "`/club_assign_officer` - Assign Officer role\n"
-                "`/club_remove_officer` - Remove Officer role"
-            ),
-            inline=False
-        )
-        
-        embed.add_field(
-            name="Channel Management",
-            value=(
-                "`/set_channel` - Set current channel as allowed\n"
-                "• Run this command in the channel you want to use\n"
-                "• Automatically replaces previous channel"
-            ),
-            inline=False
-        )
-        
-        # Leader Commands
-        embed.add_field(
-            name="━━━━━━ ⭐ Leader Commands ━━━━━━",
-            value="‎",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="Club Configuration",
-            value=(
-                "`/club_setup` - Leaders can also create clubs\n\n"
-                
-                "`/club_set_quota` - Update daily target\n"
-                "• Set daily fan quota for competitive clubs\n\n"
-                
-                "`/club_set_url` - Update club URL\n"
-                "• Paste club profile URL from uma.moe\n\n"
-                
-                "`/club_set_type` - Change club type\n"
-                "• Switch between casual and competitive"
-            ),
-            inline=False
-        )
-        
-        # Officer Note
-        embed.add_field(
-            name="━━━━━━ 🛡️ Officer Role ━━━━━━",
-            value="‎",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="ℹ️ Note",
-            value=(
-                "Officers have same permissions as regular members\n"
-                "This is an organizational role for club hierarchy display\n\n"
-                "**Members are auto-synced daily** - no manual commands needed"
-            ),
-            inline=False
-        )
-        
-        # Add support server link
-        embed.add_field(
-            name="━━━━━━ 💬 Support ━━━━━━",
-            value=(
-                f"❓ {SUPPORT_HELP_MESSAGE}: [Join Here]({SUPPORT_SERVER_URL})\n"
-                f"☕ Donation: [{DONATION_MESSAGE}]({DONATION_URL})"
-            ),
-            inline=False
-        )
-        
-        embed.set_footer(text="💡 Use autocomplete when typing commands")
-        
-        await interaction.response.edit_message(embed=embed, view=self)
+        await interaction.response.edit_message(embed=_MANAGER_HELP_EMBED, view=self)
 
 
 @client.tree.command(
@@ -4247,14 +4869,17 @@ async def help_command(interaction: discord.Interaction):
         inline=False
     )
     
-    view = HelpView()
-    await interaction.response.send_message(embed=embed, view=view, ephemeral=False)
+    await interaction.response.send_message(embed=embed, view=client.help_view, ephemeral=False)
 
 
 # ============================================================================
 # CLUB LIST PAGINATION VIEW
 # ============================================================================
 
+# Thousands separators (and spaces) dropped from quota input in one pass
+_QUOTA_STRIP = str.maketrans("", "", ",. ")
+
+
 class ClubQuotaFilterModal(discord.ui.Modal, title="🔍 Filter by Quota"):
     """Modal for filtering clubs by quota range"""
     
@@ -4275,13 +4900,12 @@ class ClubQuotaFilterModal(discord.ui.Modal, title="🔍 Filter by Quota"):
     async def on_submit(self, interaction: discord.Interaction):
         try:
             # Parse min value
-            min_val = self.min_quota.value.replace(",", "").replace(".", "").strip()
-            min_quota = int(min_val)
+            min_quota = int(self.min_quota.value.translate(_QUOTA_STRIP))
             
             # Parse max value (optional)
             max_quota = None
-            if self.max_quota.value.strip():
-                max_val = self.max_quota.value.replace(",", "").replace(".", "").strip()
+            max_val = self.max_quota.value.translate(_QUOTA_STRIP)
+            if max_val.strip():
                 max_quota = int(max_val)
             
             # Apply filter via view
@@ -4294,13 +4918,31 @@ class ClubQuotaFilterModal(discord.ui.Modal, title="🔍 Filter by Quota"):
                 ephemeral=True
             )
 
+CLUB_LIST_EMBED_CACHE_SIZE = 32  # Rendered pages kept per ClubListView
+
+# Support link field closing every club list page (constant text, built once)
+_SUPPORT_FIELD_NAME = "━━━━━━━━━━━━━━━━━━━━━━"
+_SUPPORT_FIELD_VALUE = f"**{SUPPORT_MESSAGE}**: [Join Here]({SUPPORT_SERVER_URL})"
+
+# One club's field value: (rank_str, type_title, member_count, quota_str)
+_CLUB_FIELD_TMPL = "%sType: **%s**\nMembers: **%s**\nDaily Quota: **%s** fans/day"
+
+
 class ClubListView(discord.ui.View):
     """Pagination view for club list with quota filter"""
     
-    def __init__(self, all_clubs: list, clubs_per_page: int = 5):
+    def __init__(self, all_clubs: Sequence[Tuple[str, dict]], clubs_per_page: int = 5):
         super().__init__(timeout=300)  # 5 min timeout
-        self.all_clubs_original = all_clubs.copy()  # Keep original
-        self.all_clubs = all_clubs  # Working copy
+        # Neither list is mutated - filters and Clear just rebind all_clubs
+        self.all_clubs_original = tuple(all_clubs)  # No copy when given client.config_cache_sorted
+        self.all_clubs = self.all_clubs_original
+        # Quotas parsed once, parallel to all_clubs_original, for the quota filter
+        self._quota_ints = [self._safe_int(config.get('Target_Per_Day')) for _, config in all_clubs]
+        # Club indexes ordered by quota (+ the sorted quotas) so a range is two bisects
+        self._by_quota = sorted(range(len(all_clubs)), key=self._quota_ints.__getitem__)
+        self._sorted_quotas = [self._quota_ints[i] for i in self._by_quota]
+        # Static per-club text, formatted once: {club_name: (field_name, rank_str, type_title, quota_str)}
+        self._rendered = {name: self._format_club(name, config) for name, config in all_clubs}
         self.clubs_per_page = clubs_per_page
         self.current_page = 0
         
@@ -4308,6 +4950,9 @@ class ClubListView(discord.ui.View):
         self.quota_min = None
         self.quota_max = None
         
+        # Rendered pages: {(quota_min, quota_max, page): Embed} - LRU ordered
+        self._embed_cache: OrderedDict = OrderedDict()
+        
         self._update_pagination()
         self.update_buttons()
     
@@ -4315,32 +4960,73 @@ class ClubListView(discord.ui.View):
         """Recalculate pagination after filter"""
         self.total_pages = max(1, (len(self.all_clubs) + self.clubs_per_page - 1) // self.clubs_per_page)
     
+    @staticmethod
+    def _format_club(name: str, config: dict) -> tuple:
+        """Config-only parts of a club's list entry (member count stays live)"""
+        club_type = config.get('Club_Type', 'Unknown')
+        quota = config.get('Target_Per_Day', 'N/A')
+        
+        # Type emoji
+        type_emoji = "🔥" if club_type == "competitive" else "😊"
+        
+        # Format quota (well-formed ints/digit strings skip the exception path)
+        if isinstance(quota, int) or (isinstance(quota, str) and quota.isdecimal()):
+            quota_value = int(quota)
+            quota_str = f"{quota_value:,}" if quota_value > 0 else "None"
+        else:
+            try:
+                quota_value = int(quota) if quota and quota != 'N/A' else 0
+                quota_str = f"{quota_value:,}" if quota_value > 0 else "None"
+            except:
+                quota_str = str(quota)
+        
+        # Get rank
+        rank = config.get('Rank', '')
+        rank_str = f"🏆 Rank: **#{rank}**\n" if rank else ""
+        
+        type_title = club_type.title() if club_type else 'Unknown'
+        return f"{type_emoji} {name}", rank_str, type_title, quota_str
+    
+    @staticmethod
+    def _safe_int(value) -> int:
+        """Quota cell as int (0 if blank or malformed)"""
+        if isinstance(value, int):
+            return value
+        if isinstance(value, str) and value.isdecimal():
+            return int(value)
+        try:
+            return int(value or 0)
+        except (TypeError, ValueError):
+            return 0
+    
     def _apply_quota_filter(self):
         """Apply quota filter"""
-        # Start from original
-        filtered = self.all_clubs_original.copy()
+        # No filter: share the original tuple, nothing to allocate
+        if self.quota_min is None:
+            self.all_clubs = self.all_clubs_original
+            return
         
-        # Apply quota filter
-        if self.quota_min is not None:
-            def get_quota(config):
-                try:
-                    return int(config.get('Target_Per_Day', 0) or 0)
-                except:
-                    return 0
-            
-            filtered = [
-                (name, config) for name, config in filtered
-                if get_quota(config) >= self.quota_min and
-                   (self.quota_max is None or get_quota(config) <= self.quota_max)
-            ]
+        # Apply quota filter: bisect the quota-sorted indexes, then restore name order
+        lo = bisect.bisect_left(self._sorted_quotas, self.quota_min)
+        if self.quota_max is None:
+            hi = len(self._sorted_quotas)
+        else:
+            hi = bisect.bisect_right(self._sorted_quotas, self.quota_max)
         
-        self.all_clubs = filtered
+        if lo == 0 and hi >= len(self._sorted_quotas):
+            # Range covers every club - same as no filter
+            self.all_clubs = self.all_clubs_original
+        else:
+            original = self.all_clubs_original
+            self.all_clubs = [original[i] for i in sorted(self._by_quota[lo:hi])]
     
     async def apply_quota_filter(self, interaction: discord.Interaction, min_quota: int, max_quota: int = None):
         """Filter clubs by quota range"""
-        self.quota_min = min_quota
-        self.quota_max = max_quota
-        self._apply_quota_filter()
+        # Re-submitting the active range keeps the filtered list (page 1 comes from the embed cache)
+        if (min_quota, max_quota) != (self.quota_min, self.quota_max):
+            self.quota_min = min_quota
+            self.quota_max = max_quota
+            self._apply_quota_filter()
         
         # Reset to page 1
         self.current_page = 0
@@ -4351,18 +5037,38 @@ class ClubListView(discord.ui.View):
     
     def update_buttons(self):
         """Enable/disable buttons based on current page"""
-        self.first_button.disabled = (self.current_page == 0)
-        self.previous_button.disabled = (self.current_page == 0)
-        self.next_button.disabled = (self.current_page >= self.total_pages - 1)
-        self.last_button.disabled = (self.current_page >= self.total_pages - 1)
-        # Clear filter enabled if quota filter is active
-        self.clear_filter_button.disabled = (self.quota_min is None)
+        at_first = self.current_page == 0
+        at_last = self.current_page >= self.total_pages - 1
+        disabled = {
+            "club_first": at_first,
+            "club_prev": at_first,
+            "club_next": at_last,
+            "club_last": at_last,
+            "club_clear": self.quota_min is None,  # Clear enabled only while filtering
+        }
+        for item in self.children:
+            item.disabled = disabled.get(item.custom_id, item.disabled)
     
     def get_page_embed(self) -> discord.Embed:
+        """Embed for the current page, rendered once per (filter, page)"""
+        key = (self.quota_min, self.quota_max, self.current_page)
+        embed = self._embed_cache.get(key)
+        if embed is not None:
+            self._embed_cache.move_to_end(key)
+            return embed
+        
+        embed = self._render_page_embed()
+        self._embed_cache[key] = embed
+        if len(self._embed_cache) > CLUB_LIST_EMBED_CACHE_SIZE:
+            self._embed_cache.popitem(last=False)
+        return embed
+    
+    def _render_page_embed(self) -> discord.Embed:
         """Generate embed for current page"""
         start_idx = self.current_page * self.clubs_per_page
         end_idx = min(start_idx + self.clubs_per_page, len(self.all_clubs))
-        page_clubs = self.all_clubs[start_idx:end_idx]
+        # Window over all_clubs without copying the slice (iterated once below)
+        page_clubs = islice(self.all_clubs, start_idx, end_idx)
         
         # Title 
         title = "📋 All Clubs in the System"
@@ -4387,50 +5093,29 @@ class ClubListView(discord.ui.View):
             color=discord.Color.blue()
         )
         
-        if not page_clubs:
+        if end_idx <= start_idx:
             embed.add_field(
                 name="No clubs found",
                 value="No clubs match the current filter.",
                 inline=False
             )
         else:
-            for name, config in page_clubs:
-                club_type = config.get('Club_Type', 'Unknown')
-                quota = config.get('Target_Per_Day', 'N/A')
+            for name, _ in page_clubs:
+                field_name, rank_str, type_title, quota_str = self._rendered[name]
                 
                 # Get member count
-                member_list = client.member_cache.get(name, [])
-                member_count = len(member_list) if member_list else "N/A"
-                
-                # Type emoji
-                type_emoji = "🔥" if club_type == "competitive" else "😊"
-                
-                # Format quota
-                try:
-                    quota_value = int(quota) if quota and quota != 'N/A' else 0
-                    quota_str = f"{quota_value:,}" if quota_value > 0 else "None"
-                except:
-                    quota_str = str(quota)
-                
-                # Get rank
-                rank = config.get('Rank', '')
-                rank_str = f"🏆 Rank: **#{rank}**\n" if rank else ""
+                member_count = client.member_count_cache.get(name, "N/A")
                 
                 embed.add_field(
-                    name=f"{type_emoji} {name}",
-                    value=(
-                        f"{rank_str}"
-                        f"Type: **{club_type.title() if club_type else 'Unknown'}**\n"
-                        f"Members: **{member_count}**\n"
-                        f"Daily Quota: **{quota_str}** fans/day"
-                    ),
+                    name=field_name,
+                    value=_CLUB_FIELD_TMPL % (rank_str, type_title, member_count, quota_str),
                     inline=True
                 )
         
         # Support message
         embed.add_field(
-            name="━━━━━━━━━━━━━━━━━━━━━━",
-            value=f"**{SUPPORT_MESSAGE}**: [Join Here]({SUPPORT_SERVER_URL})",
+            name=_SUPPORT_FIELD_NAME,
+            value=_SUPPORT_FIELD_VALUE,
             inline=False
         )
         
@@ -4474,7 +5159,7 @@ class ClubListView(discord.ui.View):
         # Reset quota filter
         self.quota_min = None
         self.quota_max = None
-        self.all_clubs = self.all_clubs_original.copy()
+        self.all_clubs = self.all_clubs_original
         self.current_page = 0
         self._update_pagination()
         self.update_buttons()
@@ -4495,8 +5180,8 @@ async def club_list(interaction: discord.Interaction):
     await interaction.response.defer(ephemeral=False)
     
     try:
-        # Get ALL clubs in the system
-        all_clubs = list(client.config_cache.items())
+        # Get ALL clubs in the system, already sorted by name (see _rebuild_server_index)
+        all_clubs = client.config_cache_sorted
         
         if not all_clubs:
             embed = discord.Embed(
@@ -4511,9 +5196,6 @@ async def club_list(interaction: discord.Interaction):
             await interaction.followup.send(embed=embed, ephemeral=False)
             return
         
-        # Sort clubs by name by default
-        all_clubs.sort(key=lambda x: x[0].lower())
-        
         # Create view with pagination
         view = ClubListView(all_clubs, clubs_per_page=5)
         embed = view.get_page_embed()
@@ -4652,6 +5334,15 @@ class UserQuotaModal(discord.ui.Modal, title="Set Daily Target"):
             )
 
 
+async def _notify_requester(user_id: int, message: str):
+    """DM a club requester; failures (DMs closed, unknown user) are ignored"""
+    try:
+        requester = await client.get_or_fetch_user(user_id)
+        await requester.send(message)
+    except Exception:
+        pass
+
+
 class AdminApprovalView(discord.ui.View):
     """View for admin to approve/reject club requests"""
     
@@ -4676,7 +5367,7 @@ class AdminApprovalView(discord.ui.View):
         club_name = self.club_data['name']
         
         # Check for duplicate
-        if club_name in client.config_cache:
+        if club_name in client.config_names:
             await self._handle_duplicate_deferred(interaction)
             return
         
@@ -4700,21 +5391,18 @@ class AdminApprovalView(discord.ui.View):
                 f"**Members imported:** {len(self.api_data.get('members', []))}"
             )
             
-            # Notify requester
-            try:
-                requester = await client.fetch_user(self.requester_info['user_id'])
-                await requester.send(
-                    f"✅ **Your club request was approved!**\n\n"
-                    f"**Club Name:** {club_name}\n"
-                    f"**Type:** {self.club_type.capitalize()}\n"
-                    f"**Daily Quota:** {quota_text}\n"
-                    f"**Status:** Now tracked by the bot\n\n"
-                    f"You can use:\n"
-                    f"• `/leaderboard {club_name}`\n"
-                    f"• `/stats {club_name} <member>`"
-                )
-            except:
-                pass
+            # Notify requester (in the background)
+            run_in_background(_notify_requester(
+                self.requester_info['user_id'],
+                f"✅ **Your club request was approved!**\n\n"
+                f"**Club Name:** {club_name}\n"
+                f"**Type:** {self.club_type.capitalize()}\n"
+                f"**Daily Quota:** {quota_text}\n"
+                f"**Status:** Now tracked by the bot\n\n"
+                f"You can use:\n"
+                f"• `/leaderboard {club_name}`\n"
+                f"• `/stats {club_name} <member>`"
+            ))
             
         except Exception as e:
             await interaction.followup.send(
@@ -4732,7 +5420,7 @@ class AdminApprovalView(discord.ui.View):
         
         try:
             # Notify requester
-            requester = await client.fetch_user(self.requester_info['user_id'])
+            requester = await client.get_or_fetch_user(self.requester_info['user_id'])
             await requester.send(
                 f"❌ **Your club request was rejected**\n\n"
                 f"**Club Name:** {self.club_data['name']}\n"
@@ -4780,8 +5468,8 @@ class ClubTypeSelectionView(discord.ui.View):
     )
     async def competitive(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Select competitive mode - check duplicate then ask for quota"""
-        # Check for duplicate FIRST
-        if self.club_name in client.config_cache:
+        # Check for duplicate FIRST - in-memory snapshot only, the modal must go out within 3s
+        if self.club_name in client.config_names:
             await self._handle_duplicate(interaction, club_type="competitive")
             return
         
@@ -4805,7 +5493,7 @@ class ClubTypeSelectionView(discord.ui.View):
         await interaction.response.defer()
         
         # Check for duplicate FIRST
-        if self.club_name in client.config_cache:
+        if self.club_name in client.config_names:
             await self._handle_duplicate_sync(interaction, club_type="casual", target_quota=0)
             return
         
@@ -4826,20 +5514,17 @@ class ClubTypeSelectionView(discord.ui.View):
                 f"Quota: Not applicable (casual mode)"
             )
             
-            # Notify requester
-            try:
-                requester = await client.fetch_user(self.requester_info['user_id'])
-                await requester.send(
-                    f"✅ **Your club request was approved!**\n\n"
-                    f"**Club Name:** {self.club_name}\n"
-                    f"**Type:** Casual\n"
-                    f"**Status:** Now tracked by the bot\n\n"
-                    f"You can use:\n"
-                    f"• `/leaderboard {self.club_name}`\n"
-                    f"• `/stats {self.club_name} <member>`"
-                )
-            except:
-                pass
+            # Notify requester (in the background)
+            run_in_background(_notify_requester(
+                self.requester_info['user_id'],
+                f"✅ **Your club request was approved!**\n\n"
+                f"**Club Name:** {self.club_name}\n"
+                f"**Type:** Casual\n"
+                f"**Status:** Now tracked by the bot\n\n"
+                f"You can use:\n"
+                f"• `/leaderboard {self.club_name}`\n"
+                f"• `/stats {self.club_name} <member>`"
+            ))
             
         except Exception as e:
             await interaction.followup.send(f"❌ Error: {e}")
@@ -4862,7 +5547,7 @@ class ClubTypeSelectionView(discord.ui.View):
     async def _handle_duplicate_sync(self, interaction: discord.Interaction, club_type: str, target_quota: int):
         """Handle duplicate name for casual (already deferred)"""
         try:
-            requester = await client.fetch_user(self.requester_info['user_id'])
+            requester = await client.get_or_fetch_user(self.requester_info['user_id'])
             await requester.send(
                 f"⚠️ **Your club request has a duplicate name!**\n\n"
                 f"**Club Name:** {self.club_name}\n"
@@ -4875,17 +5560,16 @@ class ClubTypeSelectionView(discord.ui.View):
             )
             
             # Store pending request with club_type and quota
-            pending_requests[self.requester_info['user_id']] = {
-                'club_data': self.club_data,
-                'api_data': self.api_data,
-                'requester_info': self.requester_info,
-                'original_name': self.club_name,
-                'club_type': club_type,
-                'target_quota': target_quota,
-                'awaiting_custom_name': True,
-                'admin_channel_id': interaction.channel_id,
-                'timestamp': time.time()
-            }
+            add_pending_request(self.requester_info['user_id'], PendingClubRequest(
+                club_data=self.club_data,
+                api_data=self.api_data,
+                requester_info=self.requester_info,
+                original_name=self.club_name,
+                club_type=club_type,
+                target_quota=target_quota,
+                admin_channel_id=interaction.channel_id,
+                timestamp=time.time()
+            ))
             
             await interaction.followup.send(
                 f"⏸️ **Duplicate detected**\n\n"
@@ -4938,7 +5622,7 @@ class QuotaInputModal(discord.ui.Modal, title="Set Daily Quota"):
             # If this is a duplicate case, DM requester and store settings
             if self.is_duplicate:
                 try:
-                    requester = await client.fetch_user(self.requester_info['user_id'])
+                    requester = await client.get_or_fetch_user(self.requester_info['user_id'])
                     await requester.send(
                         f"⚠️ **Your club request has a duplicate name!**\n\n"
                         f"**Club Name:** {self.club_name}\n"
@@ -4951,17 +5635,16 @@ class QuotaInputModal(discord.ui.Modal, title="Set Daily Quota"):
                     )
                     
                     # Store pending request with club_type and quota
-                    pending_requests[self.requester_info['user_id']] = {
-                        'club_data': self.club_data,
-                        'api_data': self.api_data,
-                        'requester_info': self.requester_info,
-                        'original_name': self.club_name,
-                        'club_type': self.club_type,
-                        'target_quota': quota,
-                        'awaiting_custom_name': True,
-                        'admin_channel_id': interaction.channel_id,
-                        'timestamp': time.time()
-                    }
+                    add_pending_request(self.requester_info['user_id'], PendingClubRequest(
+                        club_data=self.club_data,
+                        api_data=self.api_data,
+                        requester_info=self.requester_info,
+                        original_name=self.club_name,
+                        club_type=self.club_type,
+                        target_quota=quota,
+                        admin_channel_id=interaction.channel_id,
+                        timestamp=time.time()
+                    ))
                     
                     await interaction.followup.send(
                         f"⏸️ **Duplicate detected**\n\n"
@@ -4996,7 +5679,7 @@ class QuotaInputModal(discord.ui.Modal, title="Set Daily Quota"):
             
             # Notify requester
             try:
-                requester = await client.fetch_user(self.requester_info['user_id'])
+                requester = await client.get_or_fetch_user(self.requester_info['user_id'])
                 await requester.send(
                     f"✅ **Your club request was approved!**\n\n"
                     f"**Club Name:** {self.club_name}\n"
@@ -5088,59 +5771,59 @@ async def auto_create_club_from_api(
     data_sheet = f"{club_name}_Data"
     members_sheet = f"{club_name}_Members"
     
-    # Create Members sheet (non-blocking)
-    members_ws = await asyncio.to_thread(
-        gs_manager.sh.add_worksheet,
-        title=members_sheet,
-        rows=100,
-        cols=5
-    )
-    await asyncio.to_thread(members_ws.update, 'A1:B1', [['Trainer ID', 'Name']])
-    
-    # Extract and write members
+    # Extract members
     members = api_data.get('members', [])
+    # Built straight into batchUpdate RowData (both cells are text) in one pass;
+    # a null trainer_name is left empty, as the RAW write did
     member_rows = [
-        [str(m.get('viewer_id', '')), m.get('trainer_name', 'Unknown')]
+        {"values": [
+            {"userEnteredValue": {"stringValue": str(m['viewer_id']) if 'viewer_id' in m else ''}},
+            {"userEnteredValue": {"stringValue": str(m.get('trainer_name', 'Unknown') or '')}}
+        ]}
         for m in members
     ]
     
-    if member_rows:
-        await asyncio.to_thread(
-            members_ws.update,
-            f'A2:B{len(member_rows)+1}',
-            member_rows
-        )
-    
-    # Create Data sheet (non-blocking)
-    data_ws = await asyncio.to_thread(
-        gs_manager.sh.add_worksheet,
-        title=data_sheet,
-        rows=1000,
-        cols=10
-    )
-    await asyncio.to_thread(data_ws.update, 'A1:F1', [[
-        'Name', 'Day', 'Total Fans', 'Daily', 'Target', 'CarryOver'
-    ]])
-    
     # Get club URL from circle_id
     circle_id = club_data.get('circle_id', '')
     club_url = f"https://chronogenesis.net/club_profile?circle_id={circle_id}"
     
-    # Add to Clubs_Config with provided settings + Club_ID for auto-sync (non-blocking)
-    config_ws = await asyncio.to_thread(gs_manager.sh.worksheet, config.CONFIG_SHEET_NAME)
-    await asyncio.to_thread(config_ws.append_row, [
-        club_name,           # Club_Name
-        data_sheet,          # Data_Sheet_Name
-        members_sheet,       # Members_Sheet_Name
-        target_quota,        # Target_Per_Day (from parameter)
-        club_url,            # Club_URL
-
-        club_type,           # Club_Type (from parameter)
-        circle_id            # Club_ID (for auto-sync)
-    ])
-    
-    # Update caches
-    await client.update_caches()
+    config_ws = gs_manager.config_ws or await asyncio.to_thread(gs_manager.get_config_worksheet)
+    
+    # Both sheets, their headers, the member rows and the Clubs_Config row go out
+    # as one batchUpdate (run in thread) - one round-trip, and atomic, so a failure
+    # leaves no half-created club. Errors propagate to callers, which show them.
+    data_sheet_id, members_sheet_id = random.sample(range(1, 2**31 - 1), 2)
+    requests = [
+        *_add_sheet_with_header_requests(members_sheet_id, members_sheet, max(100, len(member_rows) + 1), 5, _MEMBERS_SHEET_HEADER),
+        *_add_sheet_with_header_requests(data_sheet_id, data_sheet, 1000, 10, _DATA_SHEET_HEADER),
+        # Add to Clubs_Config with provided settings + Club_ID for auto-sync
+        {"appendCells": {
+            "sheetId": config_ws.id,
+            "rows": [_row_data([
+                club_name,           # Club_Name
+                data_sheet,          # Data_Sheet_Name
+                members_sheet,       # Members_Sheet_Name
+                target_quota,        # Target_Per_Day (from parameter)
+                club_url,            # Club_URL
+                club_type,           # Club_Type (from parameter)
+                circle_id            # Club_ID (for auto-sync)
+            ])],
+            "fields": "userEnteredValue"
+        }}
+    ]
+    if member_rows:
+        requests.append({"updateCells": {
+            "start": {"sheetId": members_sheet_id, "rowIndex": 1, "columnIndex": 0},
+            "rows": member_rows,
+            "fields": "userEnteredValue"
+        }})
+    await asyncio.to_thread(gs_manager.sh.batch_update, {"requests": requests})
+    
+    # Refresh caches in the background - the admin's confirmation doesn't wait on a
+    # full reload. Until it lands, the snapshot already knows the name is taken.
+    # Forced: a refresh that just ran must not leave the new club out of the caches
+    client.config_names = client.config_names | {club_name}
+    run_in_background(client.update_caches(force=True))
     
     print(f"✅ Auto-created club: {club_name} ({club_type}, quota: {target_quota}) with {len(member_rows)} members")
 
@@ -5205,7 +5888,7 @@ async def status(interaction: discord.Interaction):
 @client.tree.command(name="uptime", description="Shows how long the bot has been online.")
 async def uptime(interaction: discord.Interaction):
     """Show bot uptime"""
-    now = datetime.datetime.now(datetime.timezone.utc)
+    now = datetime.datetime.now(UTC_TZ)
     delta = now - client.start_time
     total_seconds = int(delta.total_seconds())
     
@@ -5915,10 +6598,8 @@ async def search_club(interaction: discord.Interaction, trainer_id: str):
         )
         
         # Timestamp
-        import pytz
         from datetime import datetime
-        vietnam_tz = pytz.timezone('Asia/Ho_Chi_Minh')
-        now = datetime.now(vietnam_tz)
+        now = datetime.now(VN_TZ)
         timestamp_display = now.strftime("%b %d, %Y • %I:%M %p %Z")
         
         embed.set_footer(
@@ -6077,8 +6758,7 @@ class LeaderboardView(discord.ui.View):
             import pytz
             
             utc_time = datetime.fromtimestamp(current_timestamp, tz=pytz.UTC)
-            vietnam_tz = pytz.timezone('Asia/Ho_Chi_Minh')
-            local_time = utc_time.astimezone(vietnam_tz)
+            local_time = utc_time.astimezone(VN_TZ)
             timestamp_display = local_time.strftime("%b %d, %Y %I:%M %p %Z")
             
             lines.append(center_text_exact(f"🕐 Updated: {timestamp_display}", 56))
@@ -6284,8 +6964,9 @@ async def leaderboard(interaction: discord.Interaction, club_name: str):
     
     if not club_config:
         # Try case-insensitive search
+        club_name_folded = club_name.casefold()
         for cached_club in client.config_cache.keys():
-            if cached_club.casefold() == club_name.casefold():
+            if cached_club.casefold() == club_name_folded:
                 club_config = client.config_cache[cached_club]
                 actual_club_name = cached_club
                 break
@@ -6575,8 +7256,7 @@ class StatsView(discord.ui.View):
         from datetime import datetime
         import pytz
         utc_time = datetime.fromtimestamp(timestamp, tz=pytz.UTC)
-        vietnam_tz = pytz.timezone('Asia/Ho_Chi_Minh')
-        local_time = utc_time.astimezone(vietnam_tz)
+        local_time = utc_time.astimezone(VN_TZ)
         timestamp_display = local_time.strftime("%b %d, %Y %I:%M %p %Z")
         lines.append(f"Updated: {timestamp_display}")
         lines.append("=" * 56)
@@ -6963,8 +7643,9 @@ async def stats(interaction: discord.Interaction, club_name: str, member_name: s
     
     if not club_config:
         # Try case-insensitive search
+        club_name_folded = club_name.casefold()
         for cached_club in client.config_cache.keys():
-            if cached_club.casefold() == club_name.casefold():
+            if cached_club.casefold() == club_name_folded:
                 club_config = client.config_cache[cached_club]
                 actual_club_name = cached_club
                 break
@@ -7096,8 +7777,9 @@ async def profile(interaction: discord.Interaction):
     club_config = client.config_cache.get(club_name)
     if not club_config:
         # Try case-insensitive
+        club_name_folded = club_name.casefold()
         for cached_club in client.config_cache.keys():
-            if cached_club.casefold() == club_name.casefold():
+            if cached_club.casefold() == club_name_folded:
                 club_config = client.config_cache[cached_club]
                 club_name = cached_club
                 break
@@ -7223,7 +7905,7 @@ async def on_app_command_error(
             title=f"❌ Command Failed: /{command_name}",
             description=f"**Error Type:** {error_type}",
             color=discord.Color.red(),
-            timestamp=datetime.datetime.now(datetime.timezone.utc)
+            timestamp=datetime.datetime.now(UTC_TZ)
         )
         
         embed.add_field(
@@ -7435,16 +8117,16 @@ async def set_channel(interaction: discord.Interaction):
             'channel_name': channel.name,
             'added_by': interaction.user.id,
             'added_by_name': str(interaction.user),
-            'added_at': datetime.datetime.now(pytz.timezone('Asia/Ho_Chi_Minh')).strftime("%Y-%m-%d %H:%M:%S")
+            'added_at': datetime.datetime.now(VN_TZ).strftime("%Y-%m-%d %H:%M:%S")
         })
         
         # Update in-memory config
-        config.ALLOWED_CHANNEL_IDS = [ch['channel_id'] for ch in channels_config]
+        client.set_channel_restrictions([ch['channel_id'] for ch in channels_config])
         
         # Save to file
         config_data = {
             "channels": channels_config,
-            "last_updated": datetime.datetime.now(pytz.timezone('Asia/Ho_Chi_Minh')).strftime("%Y-%m-%d %H:%M:%S")
+            "last_updated": datetime.datetime.now(VN_TZ).strftime("%Y-%m-%d %H:%M:%S")
         }
         
         with open(ALLOWED_CHANNELS_CONFIG_FILE, 'w', encoding='utf-8') as f:
@@ -7862,8 +8544,7 @@ async def archive_current_data(worksheet, current_month: str):
 
 def get_current_month_string() -> str:
     """Get current month as MM/YYYY string (Vietnam timezone)"""
-    vietnam_tz = pytz.timezone('Asia/Ho_Chi_Minh')
-    now = datetime.datetime.now(vietnam_tz)
+    now = datetime.datetime.now(VN_TZ)
     return f"{now.month:02d}/{now.year}"
 
 @tasks.loop(time=[
@@ -7979,7 +8660,7 @@ async def send_schedule_notification():
             title="📅 Game Schedule Updated!",
             description=f"**{len(schedule_cache)} events** available.\nUse `/schedule` to view the full schedule.",
             color=discord.Color.gold(),
-            timestamp=datetime.datetime.now(datetime.timezone.utc)
+            timestamp=datetime.datetime.now(UTC_TZ)
         )
         
         if schedule_cache:
@@ -8118,11 +8799,8 @@ async def schedule_command(interaction: discord.Interaction):
 # ============================================================================
 # START SCHEDULED TASKS ON READY
 # ============================================================================
-@client.event
-async def on_ready():
-    """Start scheduled tasks when bot is ready"""
-    print(f"✅ Logged in as {client.user} (ID: {client.user.id})")
-    
+async def _startup_god_mode_panel():
+    """Register persistent views and refresh the God Mode panel"""
     # Register persistent views - REQUIRED for button handlers to work after restart
     try:
         from god_mode_panel import GodModeControlPanel, update_god_mode_panel
@@ -8133,13 +8811,36 @@ async def on_ready():
         await update_god_mode_panel(client)
     except Exception as e:
         print(f"⚠️ God Mode panel error: {e}")
-    
-    # Update caches - REQUIRED for other commands to work
+
+
+async def _startup_update_caches():
+    """Initial cache load - REQUIRED for other commands to work"""
     try:
         await client.update_caches()
         print("✅ Caches updated")
     except Exception as e:
         print(f"⚠️ Cache update error: {e}")
+
+
+@client.event
+async def on_ready():
+    """Start scheduled tasks when bot is ready"""
+    print(f"✅ Logged in as {client.user} (ID: {client.user.id})")
+    
+    # Migrate old single-channel config if needed (skipped once the sentinel exists)
+    migrate_old_channel_config()
+    
+    # Load channel restrictions into memory - global_channel_check reads only these
+    channels_config = load_channels_config()
+    if channels_config:
+        client.set_channel_restrictions([ch['channel_id'] for ch in channels_config])
+        print(f"✅ Channel restrictions active: {len(config.ALLOWED_CHANNEL_IDS)} channel(s)")
+    
+    # Independent startup steps run concurrently (each handles its own errors,
+    # so one failure never cancels the others)
+    async with asyncio.TaskGroup() as tg:
+        tg.create_task(_startup_god_mode_panel())
+        tg.create_task(_startup_update_caches())
     
     # Start scheduled tasks
     if not auto_sync_to_supabase.is_running():
@@ -72,6 +72,18 @@ class GodModeControlPanel(View):
                 inline=False
             )
             
+            # Config writes that never reached Sheets (retried before the next cache reload).
+            # Read from the running bot - `bot.client` may be a second copy of the module
+            failed_writes = list(interaction.client.failed_config_writes.values())
+            if failed_writes:
+                embed.add_field(
+                    name=f"⚠️ Failed Config Writes ({len(failed_writes)})",
+                    value="\n".join(
+                        f"• `{f.club_name}` {f.field_name}: {f.error[:80]}" for f in failed_writes[:10]
+                    ),
+                    inline=False
+                )
+            
             await interaction.followup.send(embed=embed, ephemeral=True)
         except Exception as e:
             await interaction.followup.send(f"❌ Error: {e}", ephemeral=True)
@@ -165,7 +177,7 @@ class GodModeControlPanel(View):
             from bot import client
             
             # Reset cooldown to force refresh
-            client.last_cache_update_time = 0
+            client._last_cache_update_mono = float('-inf')
             
             start_time = time.time()
             await client.update_caches()
@@ -262,12 +274,14 @@ class GodModeControlPanel(View):
         await interaction.response.defer(ephemeral=True)
         
         try:
-            from bot import ALLOWED_CHANNELS_CONFIG_FILE, config
+            from bot import ALLOWED_CHANNELS_CONFIG_FILE
             
             if os.path.exists(ALLOWED_CHANNELS_CONFIG_FILE):
                 os.remove(ALLOWED_CHANNELS_CONFIG_FILE)
             
-            config.ALLOWED_CHANNEL_IDS = []
+            # interaction.client is the running bot; `from bot import ...` can be a
+            # second copy of the module when started as `python bot.py`
+            interaction.client.set_channel_restrictions([])
             
             await interaction.followup.send(
                 "✅ **All channel restrictions cleared**\n"